@@ -12,6 +12,7 @@ package:
 * zone_processor.py
 """
 
+from functools import lru_cache
 from typing import Tuple
 import datetime
 
@@ -38,6 +39,9 @@ EPOCH_YEAR: int = 2050
 SECONDS_SINCE_UNIX_EPOCH = int(datetime.datetime(
     EPOCH_YEAR, 1, 1, tzinfo=datetime.timezone.utc).timestamp())
 
+# Number of days from Python Epoch (Unix epoch of 1970-01-01) to Epoch Year.
+DAYS_SINCE_UNIX_EPOCH = SECONDS_SINCE_UNIX_EPOCH // 86400
+
 
 def to_epoch_seconds(unix_seconds: int) -> int:
     """Convert unix seconds to internal epoch seconds."""
@@ -108,17 +112,64 @@ def calc_day_of_month(
         return (month, day)
 
 
+def is_leap_year(year: int) -> bool:
+    """Return True if 'year' is a leap year in the proleptic Gregorian
+    calendar. A year which is not divisible by 25 cannot be divisible by 100,
+    so it is a leap year if divisible by 4. Otherwise, it is divisible by 400
+    if and only if it is also divisible by 16. This replaces the 3 modulo
+    operations of the textbook formula with 1 modulo and 1 bitmask.
+    """
+    return (year & (3 if year % 25 else 15)) == 0
+
+
+# Number of days in each month of a non-leap year.
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 def days_in_year_month(year: int, month: int) -> int:
     """Return the number of days in the given (year, month). The
     month is usually 1-12, but can be 0 to indicate December of the previous
     year, and 13 to indicate Jan of the following year.
     """
-    DAYS_IN_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-    is_leap = (year % 4 == 0) and ((year % 100 != 0) or (year % 400) == 0)
-    days = DAYS_IN_MONTH[(month - 1) % 12]
     if month == 2:
-        days += is_leap
-    return days
+        return 28 + is_leap_year(year)
+    return _DAYS_IN_MONTH[(month - 1) % 12]
+
+
+def days_from_civil(year: int, month: int, day: int) -> int:
+    """Convert the (year, month, day) of the proleptic Gregorian calendar into
+    the number of days since the Unix epoch (1970-01-01), using the integer
+    algorithm of Howard Hinnant
+    (http://howardhinnant.github.io/date_algorithms.html#days_from_civil).
+    This is the inverse of civil_from_days().
+    """
+    year -= month <= 2
+    era = year // 400
+    yoe = year - era * 400  # [0, 399]
+    mp = month - 3 if month > 2 else month + 9  # [0, 11], starting from March
+    doy = (153 * mp + 2) // 5 + day - 1  # [0, 365]
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy  # [0, 146096]
+    return era * 146097 + doe - 719468
+
+
+def civil_from_days(days: int) -> Tuple[int, int, int]:
+    """Convert the number of days since the Unix epoch (1970-01-01) into the
+    (year, month, day) of the proleptic Gregorian calendar, using the integer
+    algorithm of Howard Hinnant
+    (http://howardhinnant.github.io/date_algorithms.html#civil_from_days).
+    This is much faster than the round trip through datetime.date. This is the
+    inverse of days_from_civil().
+    """
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097  # [0, 146096]
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365  # [0, 399]
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)  # [0, 365]
+    mp = (5 * doy + 2) // 153  # [0, 11], starting from March
+    day = doy - (153 * mp + 2) // 5 + 1  # [1, 31]
+    month = mp + 3 if mp < 10 else mp - 9  # [1, 12]
+    year = yoe + era * 400 + (month <= 2)
+    return (year, month, day)
 
 
 def to_utc_string(stdoffset: int, dstoffset: int) -> str:
@@ -132,20 +183,26 @@ def to_utc_string(stdoffset: int, dstoffset: int) -> str:
     )
 
 
+@lru_cache(maxsize=256)
 def seconds_to_hm_string(secs: int) -> str:
-    """Return secs as +/-hh:mm (e.g. -08:00)"""
+    """Return secs as +/-hh:mm (e.g. -08:00). Only a few dozen distinct UTC
+    offsets exist, so the results are memoized.
+    """
     if secs < 0:
-        hms = seconds_to_hms(-secs)
-        return f'-{hms[0]:02}:{hms[1]:02}'
+        sign = '-'
+        secs = -secs
     else:
-        hms = seconds_to_hms(secs)
-        return f'+{hms[0]:02}:{hms[1]:02}'
+        sign = '+'
+    h, rem = divmod(secs, 3600)
+    return f'{sign}{h:02}:{rem // 60:02}'
 
 
+@lru_cache(maxsize=256)
 def seconds_to_abbrev(secs: int) -> str:
     """Convert total UTC offset seconds to a timezone abbreviation according to
     the %z format: [+/-]hh[mm[ss]] using the shortest form that does not lose
-    information.
+    information. Only a few dozen distinct UTC offsets exist, so the results
+    are memoized.
     """
     s = secs if secs >= 0 else -secs
     hms = seconds_to_hms(s)
@@ -8,15 +8,13 @@ Internal date-time component classes needed to handle hours in the form 24:00 or
 easier.
 """
 
-import logging
 from datetime import datetime
-from datetime import timedelta
-from datetime import date
 from typing import NamedTuple
 
 from .common import MIN_YEAR
+from .common import civil_from_days
+from .common import days_from_civil
 from .common import hms_to_seconds
-from .common import seconds_to_hms
 
 
 class DateTuple(NamedTuple):
@@ -30,14 +28,22 @@ class DateTuple(NamedTuple):
     f: str  # modifier ('w', 's', 'u')
 
 
-def subtract_date_tuple(a: DateTuple, b: DateTuple) -> int:
-    """Number of seconds in (a - b), ignoring the 'format' field.
+def date_tuple_to_key(dt: DateTuple) -> int:
+    """Pack the (y, M, d, ss) fields of the DateTuple into a single int which
+    sorts in the same order as the tuple itself, ignoring the 'f' field. This
+    allows a single int comparison instead of an element-wise tuple
+    comparison. The 'ss' field must be within the range of [-2^19, 2^19).
     """
-    da = date(a.y, a.M, a.d)
-    db = date(b.y, b.M, b.d)
-    diff_days = da.toordinal() - db.toordinal()
-    diff_seconds = a.ss - b.ss
-    return diff_days * 86400 + diff_seconds
+    return (((dt.y * 16 + dt.M) * 32 + dt.d) << 20) + dt.ss + 0x80000
+
+
+def datetime_to_key(dt: datetime) -> int:
+    """Return the packed int key of the given 'datetime', equivalent to
+    date_tuple_to_key(datetime_to_datetuple(dt, f)) but without creating the
+    intermediate DateTuple.
+    """
+    secs = dt.hour * 3600 + dt.minute * 60 + dt.second
+    return (((dt.year * 16 + dt.month) * 32 + dt.day) << 20) + secs + 0x80000
 
 
 def datetime_to_datetuple(dt: datetime, format: str) -> DateTuple:
@@ -50,25 +56,32 @@ def datetime_to_datetuple(dt: datetime, format: str) -> DateTuple:
 
 def normalize_date_tuple(tt: DateTuple) -> DateTuple:
     """Return the normalized DateTuple where the dt.ss could be negative or
-    greater than 24h. Throws exception if the normalization fails.
-    TODO: Reimplement logic of ExtendedZoneProcessor::normalizeDateTuple().
+    greater than 24h. The calculation uses integer arithmetic on the days since
+    the Unix epoch instead of datetime and timedelta objects.
     """
     if tt.y == MIN_YEAR:
         return DateTuple(y=MIN_YEAR, M=1, d=1, ss=0, f=tt.f)
 
-    try:
-        st = datetime(tt.y, tt.M, tt.d)
-        delta = timedelta(seconds=tt.ss)
-        st += delta
-        return datetime_to_datetuple(st, tt.f)
-    except:  # noqa: E722
-        logging.error('Invalid datetime: %s + %s', st, delta)
-        raise
+    ss = tt.ss
+    if 0 <= ss < 86400:
+        return tt
+
+    days, ss = divmod(ss, 86400)
+    y, M, d = civil_from_days(days_from_civil(tt.y, tt.M, tt.d) + days)
+    return DateTuple(y=y, M=M, d=d, ss=ss, f=tt.f)
 
 
 def date_tuple_to_string(dt: DateTuple) -> str:
-    (h, m, s) = seconds_to_hms(dt.ss)
-    return f'{dt.y:04}-{dt.M:02}-{dt.d:02}T{h:02}:{m:02}{dt.f}'
+    """Return the DateTuple as yyyy-mm-ddThh:mm{f}. The string is concatenated
+    from zfill()'ed fields, which is faster than the equivalent f-string
+    format specifiers.
+    """
+    (h, m) = divmod(dt.ss // 60, 60)
+    return (
+        str(dt.y).zfill(4) + '-' + str(dt.M).zfill(2) + '-'
+        + str(dt.d).zfill(2) + 'T' + str(h).zfill(2) + ':' + str(m).zfill(2)
+        + dt.f
+    )
 
 
 class YearMonthTuple(NamedTuple):
@@ -3,22 +3,43 @@
 # MIT License
 
 from typing import Optional
+from typing import Tuple
 from datetime import datetime, tzinfo, timedelta, timezone
 
 from .common import to_epoch_seconds
+from .zone_processor import OffsetInfo
 from .zone_processor import ZoneProcessor
 from .typing import ZoneInfo, ZoneInfoMap
 
 
+# (year, month, day, hour, minute, second, fold) of a datetime.
+_DateTimeKey = Tuple[int, int, int, int, int, int, int]
+
+
 class acetz(tzinfo):
     """An implementation of datetime.tzinfo using the ZoneProcessor class.
     """
 
     def __init__(self, zone_info: ZoneInfo):
         self.zp = ZoneProcessor(zone_info)
+        # 1-slot cache of the (key, OffsetInfo) of the most recent lookup,
+        # stored as a single tuple so that it is updated atomically.
+        self._last_info: Optional[Tuple[_DateTimeKey, OffsetInfo]] = None
+
+    def _lookup_info(self, dt: datetime) -> OffsetInfo:
+        """Return the OffsetInfo for the given 'dt', raising an Exception if
+        not found. The datetime methods usually call utcoffset(), dst() and
+        tzname() in a row with the same 'dt', so the last result is cached.
+        The lookup depends only on the date/time fields (to the second) and
+        the fold of 'dt'.
+        """
+        key = (
+            dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.fold
+        )
+        last_info = self._last_info
+        if last_info is not None and last_info[0] == key:
+            return last_info[1]
 
-    def utcoffset(self, dt: Optional[datetime]) -> timedelta:
-        assert dt
         info = self.zp.get_timezone_info_for_datetime(dt)
         if not info:
             raise Exception(
@@ -26,19 +47,16 @@ class acetz(tzinfo):
                 f'{dt.year:04}-{dt.month:02}-{dt.day:02} '
                 f'{dt.hour:02}:{dt.minute:02}:{dt.second:02}'
             )
+        self._last_info = (key, info)
+        return info
 
-        return timedelta(seconds=info.total_offset)
+    def utcoffset(self, dt: Optional[datetime]) -> timedelta:
+        assert dt
+        return timedelta(seconds=self._lookup_info(dt).total_offset)
 
     def dst(self, dt: Optional[datetime]) -> timedelta:
         assert dt
-        offset_info = self.zp.get_timezone_info_for_datetime(dt)
-        if not offset_info:
-            raise Exception(
-                f'Unknown timezone info for '
-                f'{dt.year:04}-{dt.month:02}-{dt.day:02} '
-                f'{dt.hour:02}:{dt.minute:02}:{dt.second:02}'
-            )
-        return timedelta(seconds=offset_info.dst_offset)
+        return timedelta(seconds=self._lookup_info(dt).dst_offset)
 
     def tzname(self, dt: Optional[datetime]) -> str:
         """Return the abbreviation of the timezone, instead of the full name,
@@ -46,14 +64,7 @@ class acetz(tzinfo):
         and zoneinfo). Use tzfullname() to get the full name of the time zone.
         """
         assert dt
-        offset_info = self.zp.get_timezone_info_for_datetime(dt)
-        if not offset_info:
-            raise Exception(
-                f'Unknown timezone info for '
-                f'{dt.year:04}-{dt.month:02}-{dt.day:02} '
-                f'{dt.hour:02}:{dt.minute:02}:{dt.second:02}'
-            )
-        return offset_info.abbrev
+        return self._lookup_info(dt).abbrev
 
     def fromutc(self, dt: Optional[datetime]) -> datetime:
         """Override the default implementation in tzinfo which does not make
@@ -9,15 +9,22 @@ Data structure to store and saerch the DST transitions for a given time zone.
 import logging
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from .common import to_utc_string
 from .date_tuple import DateTuple
 from .date_tuple import date_tuple_to_string
+from .date_tuple import date_tuple_to_key
 from .typing import ZoneRule
 from .typing import ZoneEra
 
 
 NULL_DATE_TUPLE = DateTuple(0, 0, 0, 0, 'w')
+NULL_DATE_KEY = date_tuple_to_key(NULL_DATE_TUPLE)
+
+# Index of each time suffix in the (w, s, u) tuple of
+# Transition.transition_time_keys.
+SUFFIX_INDEXES = {'w': 0, 's': 1, 'u': 2}
 
 
 class MatchingEra:
@@ -25,6 +32,19 @@ class MatchingEra:
     interest. The interval is usually a 14-month interval that begins a month
     before the year of interest, and extends a month after the year of interest.
     """
+    __slots__ = (
+        'start_date_time',
+        'until_date_time',
+        'until_key',
+        'until_suffix_index',
+        'start_month_index',
+        'until_month_index',
+        'start_keys',
+        'zone_era',
+        'prev_match',
+        'last_transition',
+    )
+
     def __init__(
         self, *,
         start_date_time: DateTuple,
@@ -38,6 +58,23 @@ class MatchingEra:
         # until_date_time of the current ZoneEra, bounded by viewing window
         self.until_date_time = until_date_time
 
+        # the packed int key of until_date_time, see date_tuple_to_key()
+        self.until_key = date_tuple_to_key(until_date_time)
+
+        # the index of the 'f' suffix of until_date_time in (w, s, u), or -1
+        # if the suffix is not recognized
+        self.until_suffix_index = SUFFIX_INDEXES.get(until_date_time.f, -1)
+
+        # the (12 * y + M) month index of start_date_time and until_date_time,
+        # used by the fuzzy comparison of transition times to this match
+        self.start_month_index = 12 * start_date_time.y + start_date_time.M
+        self.until_month_index = 12 * until_date_time.y + until_date_time.M
+
+        # the packed int keys of the (w, s, u) versions of start_date_time,
+        # computed lazily by _compare_transition_to_match() using the UTC
+        # offsets of prev_match.last_transition
+        self.start_keys: Optional[Tuple[int, int, int]] = None
+
         # the ZoneEra corresponding to this match
         self.zone_era = zone_era
 
@@ -69,16 +106,37 @@ class Transition:
     2) A boundary between one ZoneEra and the next ZoneEra.
     3) A ZoneRule that has been shifted to the boundary of a ZoneEra.
     """
+    __slots__ = (
+        'transition_time',
+        'matching_era',
+        'start_date_time',
+        'until_date_time',
+        'start_key',
+        'until_key',
+        'transition_time_w',
+        'transition_time_keys',
+        'original_transition_time',
+        'start_epoch_second',
+        'abbrev',
+        'zone_rule',
+        'format',
+        'offset_seconds',
+        'delta_seconds',
+        'letter',
+        'match_status',
+    )
+
     def __init__(
         self, *,
         matching_era: MatchingEra,
         transition_time: DateTuple,
+        zone_rule: Optional[ZoneRule] = None,
     ):
         # The transition times for both simple Match and named Match. (1) For a
         # simple Transition, the transition_time is the startTime of the
         # ZoneEra. (2) For a named Transition, the transition_time is the AT
         # field of the corresponding ZoneRule (see
-        # _create_transition_for_year()).
+        # _create_transition()).
         self.transition_time = transition_time
         self.matching_era = matching_era
 
@@ -101,10 +159,18 @@ class Transition:
         self.start_date_time = matching_era.start_date_time
         self.until_date_time = matching_era.until_date_time
 
-        # the 'w', 's' and 'u' versions of 'transition_time'
+        # The packed int keys of the final start_date_time and until_date_time,
+        # set by _generate_start_until_times(). See date_tuple_to_key().
+        self.start_key = 0
+        self.until_key = 0
+
+        # the 'w' version of 'transition_time'
         self.transition_time_w = NULL_DATE_TUPLE
-        self.transition_time_s = NULL_DATE_TUPLE
-        self.transition_time_u = NULL_DATE_TUPLE
+
+        # the packed int keys of the 'w', 's' and 'u' transition times (in
+        # that order, see SUFFIX_INDEXES), see date_tuple_to_key()
+        self.transition_time_keys: Tuple[int, int, int] = (
+            NULL_DATE_KEY, NULL_DATE_KEY, NULL_DATE_KEY)
 
         # If the Transition is a prior Transition or an exact matching
         # Transition, its transition_time is clobbered to the start time of the
@@ -123,51 +189,30 @@ class Transition:
         # If this Transition was created from MatchingEra with a named
         # ZonePolicy, this points to the ZoneRule that generated this. For a
         # simple MatchingEra, this will be None.
-        self.zone_rule: Optional[ZoneRule] = None
+        self.zone_rule = zone_rule
+
+        # The FORMAT, STDOFF, SAVE and LETTER fields of this Transition, taken
+        # from the ZoneEra and the ZoneRule. They are copied here once because
+        # they are read many times while calculating the transitions and
+        # looking up the OffsetInfo.
+        zone_era = matching_era.zone_era
+        self.format: str = zone_era['format']
+        self.offset_seconds: int = zone_era['offset_seconds']
+        if zone_rule:
+            self.delta_seconds: int = zone_rule['delta_seconds']
+            self.letter: str = zone_rule['letter']
+        else:
+            self.delta_seconds = zone_era['era_delta_seconds']
+            self.letter = ''
 
         # Transition compared to its enclosing MatchingEra. See MATCH_STATUS_*
         # parameters and _process_transition_match_status().
         self.match_status: int = 0
 
-    @property
-    def format(self) -> str:
-        return self.matching_era.zone_era['format']
-
-    @property
-    def offset_seconds(self) -> int:
-        return self.matching_era.zone_era['offset_seconds']
-
-    @property
-    def letter(self) -> str:
-        return self.zone_rule['letter'] if self.zone_rule else ''
-
-    @property
-    def delta_seconds(self) -> int:
-        if self.zone_rule:
-            return self.zone_rule['delta_seconds']
-        else:
-            return self.matching_era.zone_era['era_delta_seconds']
-
     @property
     def total_seconds(self) -> int:
         return self.offset_seconds + self.delta_seconds
 
-    def copy(self) -> 'Transition':
-        result = self.__class__.__new__(self.__class__)
-        result.matching_era = self.matching_era
-        result.start_date_time = self.start_date_time
-        result.until_date_time = self.until_date_time
-        result.transition_time = self.transition_time
-        result.transition_time_w = self.transition_time_w
-        result.transition_time_s = self.transition_time_s
-        result.transition_time_u = self.transition_time_u
-        result.original_transition_time = self.original_transition_time
-        result.start_epoch_second = self.start_epoch_second
-        result.abbrev = self.abbrev
-        result.zone_rule = self.zone_rule
-        result.match_status = self.match_status
-        return result
-
     def __repr__(self) -> str:
         sepoch = self.start_epoch_second if self.start_epoch_second else '-'
         policy_name = policy_name_of(self.matching_era.zone_era)
@@ -258,14 +303,12 @@ def check_transitions_sorted(name: str, transitions: List[Transition]) -> None:
     """
     prev = None
     for transition in transitions:
-        if not prev:
-            prev = transition
-            continue
-        if prev.transition_time > transition.transition_time:
+        if prev and prev.transition_time > transition.transition_time:
             print_transitions(
                 f'Policy {name}: Unsorted Transitions',
                 transitions)
             raise Exception('Transitions not sorted')
+        prev = transition
 
 
 def policy_name_of(era: ZoneEra) -> str:
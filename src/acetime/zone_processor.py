@@ -10,12 +10,17 @@ size for its TransitionStorage.
 
 import sys
 import logging
+from bisect import bisect_left
+from bisect import bisect_right
 from datetime import datetime
-from datetime import timedelta
+from functools import lru_cache
 from typing import List
 from typing import NamedTuple
 from typing import Optional
 from typing import Tuple
+from typing import Dict
+from typing import Generic
+from typing import TypeVar
 from typing import cast
 
 from .common import EPOCH_YEAR
@@ -24,12 +29,15 @@ from .common import MIN_YEAR
 from .common import MAX_TO_YEAR
 from .common import to_unix_seconds
 from .common import calc_day_of_month
+from .common import civil_from_days
+from .common import days_from_civil
+from .common import DAYS_SINCE_UNIX_EPOCH
 from .common import seconds_to_abbrev
 from .date_tuple import YearMonthTuple
 from .date_tuple import DateTuple
-from .date_tuple import datetime_to_datetuple
+from .date_tuple import date_tuple_to_key
+from .date_tuple import datetime_to_key
 from .date_tuple import normalize_date_tuple
-from .date_tuple import subtract_date_tuple
 from .transition import Transition
 from .transition import TransitionStorage
 from .transition import MatchingEra
@@ -73,13 +81,15 @@ def to_offset_info(transition: Transition, fold: int) -> OffsetInfo:
     )
 
 
-class TransitionMatch(NamedTuple):
-    """The result of a _find_transition_for_seconds().
-    * fold=0 means there was no overlap with the previous transition
-    * fold=1 means there was an overlap with the previous transition
+class YearCacheEntry(NamedTuple):
+    """The results of init_for_year() for a single year, saved so that
+    switching back to a recently used year does not recompute them.
     """
-    transition: Transition
-    fold: int
+    matches: List[MatchingEra]
+    transitions: List[Transition]
+    start_epoch_seconds: List[int]
+    index_free: int
+    index_beyond: int
 
 
 # Various comparison states when comparing the Transition transition_time
@@ -91,14 +101,6 @@ MATCH_STATUS_WITHIN_MATCH = 1
 MATCH_STATUS_FAR_FUTURE = 2
 
 
-def _match_status_is_active(match_status: int) -> bool:
-    return (
-        match_status == MATCH_STATUS_EXACT_MATCH
-        or match_status == MATCH_STATUS_WITHIN_MATCH
-        or match_status == MATCH_STATUS_PRIOR
-    )
-
-
 class ZoneProcessor:
     """Extract DST transition information for a given ZoneInfo. The
     DST transition information can be retrieved using the following methods:
@@ -136,6 +138,9 @@ class ZoneProcessor:
         info = zone_processor.get_timezone_info_for_datetime(dt)
     """
 
+    # Number of years of init_for_year() results retained by year_cache.
+    YEAR_CACHE_SIZE = 4
+
     def __init__(
         self,
         zone_info: ZoneInfo,
@@ -155,6 +160,10 @@ class ZoneProcessor:
         # Used by init_*() to indicate the current year of interest.
         self.year = 0
 
+        # Results of the most recently used years of init_for_year(), in least
+        # recently used order, holding at most YEAR_CACHE_SIZE entries.
+        self.year_cache: Dict[int, YearCacheEntry] = {}
+
         # List of ZoneEra which match the interval of interest.
         self.matches: List[MatchingEra] = []
 
@@ -162,21 +171,25 @@ class ZoneProcessor:
         # init_for_year().
         self.transitions: List[Transition] = []
 
+        # The start_epoch_second of each element in self.transitions, for a
+        # binary search in _find_transition_index_for_seconds().
+        self.start_epoch_seconds: List[int] = []
+
         # Indexes to keep track of the high water mark for the C++
         # implementation.
         self.transition_storage = TransitionStorage()
 
-    def get_transition_for_seconds(
-        self,
-        epoch_seconds: int,
-    ) -> Optional[Transition]:
-        """Return Transition for the given epoch_seconds.
+        # The OffsetInfo returned by the most recent
+        # get_timezone_info_for_seconds(), and the interval of epoch seconds
+        # [info_start_seconds, info_until_seconds) over which that OffsetInfo
+        # remains valid.
+        self.info_start_seconds = 0
+        self.info_until_seconds = 0
+        self.info: Optional[OffsetInfo] = None
 
-        TOOD: Does not seem to be used at all. Remove?
-        """
-        self._init_for_second(epoch_seconds)
-        tmatch = self._find_transition_for_seconds(epoch_seconds)
-        return tmatch.transition if tmatch else None
+        # The smallest year for which is_terminal_year() is True, calculated
+        # lazily by _calc_terminal_year().
+        self.terminal_year: Optional[int] = None
 
     def get_transition_for_datetime(
         self,
@@ -195,15 +208,48 @@ class ZoneProcessor:
         epoch_seconds: int
     ) -> Optional[OffsetInfo]:
         """Return the OffsetInfo of the given epoch_seconds.
+
+        Most queries fall between the same 2 transitions as the previous
+        query, so the previous OffsetInfo is returned directly if the
+        epoch_seconds is within the interval over which it is valid. In that
+        case, init_for_year() is not called, and self.transitions may retain
+        the Transitions of a different year.
         """
+        if self.info_start_seconds <= epoch_seconds < self.info_until_seconds:
+            return self.info
+
         self._init_for_second(epoch_seconds)
+        index = self._find_transition_index_for_seconds(epoch_seconds)
+        if index < 0:
+            return None
 
-        tmatch = self._find_transition_for_seconds(epoch_seconds)
-        return (
-            to_offset_info(tmatch.transition, tmatch.fold)
-            if tmatch
-            else None
-        )
+        # The fold is 1 if epoch_seconds falls within the overlap with the
+        # previous transition.
+        overlap_until_seconds = self._find_overlap_until_seconds(index)
+        fold = 1 if epoch_seconds < overlap_until_seconds else 0
+        info = to_offset_info(self.transitions[index], fold)
+
+        # Remember the interval after the overlap (if any) with the previous
+        # transition, until the start of the next transition, over which the
+        # OffsetInfo (with fold=0) does not change. The interval is not known
+        # for the last transition, so don't cache that. The interval is
+        # clamped to the UTC year used by _init_for_second() to select
+        # self.transitions, because the start of the first transition is
+        # clamped to the start of the window of the year, and seconds outside
+        # that year must be resolved using the transitions of their own year.
+        if fold == 0 and index + 1 < len(self.transitions):
+            year_start_seconds = (
+                _days_from_civil(self.year, 1, 1) - DAYS_SINCE_UNIX_EPOCH
+            ) * 86400
+            year_until_seconds = (
+                _days_from_civil(self.year + 1, 1, 1) - DAYS_SINCE_UNIX_EPOCH
+            ) * 86400
+            self.info_start_seconds = max(
+                overlap_until_seconds, year_start_seconds)
+            self.info_until_seconds = min(
+                self.start_epoch_seconds[index + 1], year_until_seconds)
+            self.info = info
+        return info
 
     def get_timezone_info_for_datetime(
         self,
@@ -213,7 +259,7 @@ class ZoneProcessor:
         """
         self.init_for_year(dt.year)
         transition = self._find_transition_for_datetime(dt)
-        if not transition:
+        if transition is None:
             return None
         return to_offset_info(transition, fold=dt.fold)
 
@@ -247,9 +293,49 @@ class ZoneProcessor:
                     self.zone_info['name'])
             return
 
+        # Restore the results of a recently used year, including the indexes
+        # of the TransitionStorage so that get_buffer_sizes() is unchanged.
+        # Look in the cache of this instance first, then in the cache shared
+        # by all instances for the same zone_info. Skip the shared cache in
+        # debug mode, so that the calculation is always logged.
+        entry = self.year_cache.pop(year, None)
+        if entry is None and not self.debug:
+            entry = _SHARED_YEAR_CACHE.get(self.zone_info, year)
+        if entry is not None:
+            if self.debug:
+                logging.info(
+                    '==== %s: init_for_year(): restored from year cache',
+                    self.zone_info['name'])
+            self.year = year
+            self.matches = entry.matches
+            self.transitions = entry.transitions
+            self.start_epoch_seconds = entry.start_epoch_seconds
+            self.transition_storage.index_free = entry.index_free
+            self.transition_storage.index_beyond = entry.index_beyond
+        else:
+            self._init_for_year(year)
+            entry = YearCacheEntry(
+                matches=self.matches,
+                transitions=self.transitions,
+                start_epoch_seconds=self.start_epoch_seconds,
+                index_free=self.transition_storage.index_free,
+                index_beyond=self.transition_storage.index_beyond,
+            )
+            _SHARED_YEAR_CACHE.put(self.zone_info, entry, year)
+
+        if len(self.year_cache) >= self.YEAR_CACHE_SIZE:
+            del self.year_cache[next(iter(self.year_cache))]
+        self.year_cache[year] = entry
+
+    def _init_for_year(self, year: int) -> None:
+        """Calculate the Matches and Transitions for the year, without
+        consulting the caches.
+        """
+        debug = self.debug
         self.year = year
         self.matches = []
         self.transitions = []
+        self.start_epoch_seconds = []
         self.transition_storage.clear()
 
         # Restrict transitions to the 14 months from Dec of the previous year
@@ -257,36 +343,40 @@ class ZoneProcessor:
         start_ym = YearMonthTuple(year - 1, 12)
         until_ym = YearMonthTuple(year + 1, 2)
 
-        if self.debug:
+        if debug:
             logging.info('---- Step 1: Finding matches')
         self.matches = self._find_matches(start_ym, until_ym)
 
-        if self.debug:
+        if debug:
             logging.info('---- Step 2: Creating (raw) transitions')
         self._create_transitions(self.matches)
-        if self.debug:
+        if debug:
             print_transitions('All Transitions', self.transitions)
 
         # Some transitions from simple match may be in 's' or 'u', so
         # convert to 'w'.
-        if self.debug:
+        if debug:
             logging.info('---- Step 3: Fixing transitions times')
         _fix_transition_times(self.transitions)
-        if self.debug:
+        if debug:
             print_transitions('All Transitions', self.transitions)
 
-        if self.debug:
+        if debug:
             logging.info('---- Step 4: Generating start and until times')
         self._generate_start_until_times(self.transitions)
-        if self.debug:
+        if debug:
             print_transitions('All Transitions', self.transitions)
 
-        if self.debug:
+        if debug:
             logging.info('---- Step 5: Calculating abbreviations')
         self._calc_abbrev(self.transitions)
-        if self.debug:
+        if debug:
             print_transitions('All Transitions', self.transitions)
 
+        self.start_epoch_seconds = [
+            t.start_epoch_second for t in self.transitions
+        ]
+
     def get_buffer_sizes(self) -> BufferSizeInfo:
         """Return the number of active transitions and the transition buffer
         size that was required to obtain them.
@@ -312,47 +402,52 @@ class ZoneProcessor:
                 3.2.2) If all matching Rules are infinite or none, return True.
             3.3) Otherwise, some matching Rules are finite, so return False.
         """
+        # The answer is monotonic in 'year', so it is determined by the
+        # smallest terminal year, which is calculated once.
+        terminal_year = self.terminal_year
+        if terminal_year is None:
+            terminal_year = self._calc_terminal_year()
+            self.terminal_year = terminal_year
+        return year >= terminal_year
+
+    def _calc_terminal_year(self) -> int:
+        """Return the smallest year for which is_terminal_year() is True,
+        following the rules listed in is_terminal_year():
+
+        * All years before the start of the last ZoneEra are not terminal
+          (rule 2).
+        * A year before the FROM year of any Rule of the last ZoneEra is not
+          terminal (rule 3.2.1).
+        * A year within the [FROM, TO] range of a finite Rule of the last
+          ZoneEra is not terminal (rule 3.3).
+        * Any year beyond the last ZoneEra is terminal (rule 1).
+        """
         # The 'eras' is always defined, whether Zone or Link.
         zone_eras = self.zone_info.get('eras')
         assert zone_eras is not None
 
-        # 1) Check if the year is beyond the last ZoneEra.
+        # 2) A year is terminal only if it is within or after the last ZoneEra.
         zone_era = zone_eras[-1]
-        until_year = zone_era['until_year']
-        if year > until_year:  # check >= (until_year + 1), to be safe
-            return True
-
-        # 2) Check if year matches the last ZoneEra.
-        prev_until_year = 0
+        terminal_year = 0
         if len(zone_eras) > 1:
-            prev_until_year = zone_eras[-2]['until_year']
-        if year < prev_until_year:
-            return False
+            terminal_year = zone_eras[-2]['until_year']
 
-        # 3.1) Check if the last ZoneEra is a Simple one.
+        # 3.1) The last ZoneEra is a Simple one.
         zone_policy = zone_era.get('zone_policy')
         if not zone_policy:
-            return True
+            return terminal_year
 
-        # 3.2) Last ZoneEra was a Named era, so search the Rules of the Policy.
-        rules = zone_policy['rules']
-        num_finite_matches = 0
-        num_infinite_matches = 0
-        for rule in rules:
-            from_year = rule['from_year']
-            if year < from_year:
-                return False  # 3.2.1
-            else:  # year >= from_year
-                to_year = rule['to_year']
-                if to_year == MAX_TO_YEAR:
-                    num_infinite_matches += 1
-                elif year <= to_year:
-                    num_finite_matches += 1
-        if num_finite_matches == 0:
-            return True  # 3.2.2
-
-        # 3.3) Otherwise, some matching Rules are finite.
-        return False
+        # 3.2) Last ZoneEra was a Named era, so the year must be at or after
+        # the FROM year of every Rule, and after the TO year of the finite
+        # Rules.
+        for rule in zone_policy['rules']:
+            terminal_year = max(terminal_year, rule['from_year'])
+            to_year = rule['to_year']
+            if to_year != MAX_TO_YEAR:
+                terminal_year = max(terminal_year, to_year + 1)
+
+        # 1) Every year beyond the last ZoneEra is terminal.
+        return min(terminal_year, zone_era['until_year'] + 1)
 
     def is_link(self) -> bool:
         return 'link_to' in self.zone_info
@@ -378,66 +473,41 @@ class ZoneProcessor:
     def _init_for_second(self, epoch_seconds: int) -> None:
         """Initialize the Transitions from the given epoch_seconds.
         """
-        ldt = datetime.utcfromtimestamp(to_unix_seconds(epoch_seconds))
-        self.init_for_year(ldt.year)
-
-    def _find_transition_for_seconds(
-        self,
-        epoch_seconds: int,
-    ) -> Optional[TransitionMatch]:
-        """Return the matching transition along with the 'fold' information.
-        Return None if not found.
-
-        * fold==0 if the transition was the first matching transition
-        * fold==1 if the transition was the second of an overlapping match.
+        days = to_unix_seconds(epoch_seconds) // 86400
+        year, _, _ = civil_from_days(days)
+        self.init_for_year(year)
+
+    def _find_transition_index_for_seconds(self, epoch_seconds: int) -> int:
+        """Return the index into self.transitions of the transition which
+        matches the given epoch_seconds, or -1 if not found. The index, instead
+        of the Transition itself, is returned because
+        _find_overlap_until_seconds() needs to look at the previous transition.
         """
-        # Use indexing instead of iterator because we need access to the
-        # transition[match-2] element, and it's much easier to do that with
-        # indexing. Scan until we get to a transition *just* after the one that
-        # matches.
-        matching_index = -1
-        for i in range(len(self.transitions)):
-            transition = self.transitions[i]
-            if transition.start_epoch_second > epoch_seconds:
-                break
-            matching_index = i
-
-        # If no match, return None.
-        if matching_index == -1:
-            return None
-
-        fold = self._determine_fold(epoch_seconds, matching_index)
-
-        transition_match = TransitionMatch(
-            self.transitions[matching_index],
-            fold,
-        )
-        return transition_match
-
-    def _determine_fold(self, epoch_seconds: int, matching_index: int) -> int:
-        """Determine the 'fold' by looking at the transition just before the
-        matching one. If the prev and current transition overlap, *and* the
-        epoch_seconds falls within the overlap, then set the fold to 1,
-        otherwise 0.
+        # The transitions are sorted by start_epoch_second, so a binary search
+        # finds the index of the transition *just* before the one that starts
+        # after epoch_seconds.
+        return bisect_right(self.start_epoch_seconds, epoch_seconds) - 1
+
+    def _find_overlap_until_seconds(self, matching_index: int) -> int:
+        """Return the epoch seconds at the end of the overlap of the matching
+        transition with the previous transition, or the start_epoch_second of
+        the matching transition if there is no overlap (i.e. the transition
+        caused a gap, or it is the first transition).
         """
+        transition = self.transitions[matching_index]
         if matching_index < 1:
-            return 0
-
-        overlap_interval = subtract_date_tuple(
-            self.transitions[matching_index - 1].until_date_time,
-            self.transitions[matching_index].start_date_time,
-        )
-        # No fold if the transition caused a gap.
+            return transition.start_epoch_second
+
+        # The until_date_time of the previous transition and the
+        # start_date_time of the matching transition refer to the same instant,
+        # expressed in the UTC offsets of the two transitions. So the overlap
+        # is simply the difference of the UTC offsets.
+        prev = self.transitions[matching_index - 1]
+        overlap_interval = prev.total_seconds - transition.total_seconds
+        # No overlap if the transition caused a gap.
         if overlap_interval <= 0:
-            return 0
-
-        transition_start = self.transitions[matching_index].start_epoch_second
-        seconds_from_transition_start = epoch_seconds - transition_start
-        # No fold if epoch_seconds is beyond the overlap interval.
-        if seconds_from_transition_start >= overlap_interval:
-            return 0
-
-        return 1
+            return transition.start_epoch_second
+        return transition.start_epoch_second + overlap_interval
 
     def _find_transition_for_datetime(
         self,
@@ -456,30 +526,42 @@ class ZoneProcessor:
             * return the later transition (earlier UTC) if dt.fold == 1,
             * see PEP 495 for details.
         """
-        dt_time = datetime_to_datetuple(dt, 'w')
+        # The start and until times of the Transitions are all in 'w' units, so
+        # they can be compared against 'dt' using their packed int keys.
+        dt_time = datetime_to_key(dt)
+
+        # For fold=0, an exact match is returned immediately, and a gap returns
+        # the transition before the gap.
+        if dt.fold == 0:
+            prev: Optional[Transition] = None
+            for transition in self.transitions:
+                if transition.start_key > dt_time:
+                    return prev
+                if dt_time < transition.until_key:
+                    return transition
+                prev = transition
+            return prev
 
+        # For fold=1, remember the first exact match, and return the second
+        # exact match if the 'dt' is in the overlap. If the 'dt' is in the gap,
+        # return the transition after the gap.
         prev_exact: Optional[Transition] = None
         prev_transition: Optional[Transition] = None
         for transition in self.transitions:
-            start_time = transition.start_date_time
-            until_time = transition.until_date_time
+            start_time = transition.start_key
+            until_time = transition.until_key
 
             exact_match = start_time <= dt_time and dt_time < until_time
             if exact_match:
-                if dt.fold == 0:
-                    return transition
                 if prev_exact is not None:
                     # In the fold/overlap.
                     return transition
                 prev_exact = transition
             elif start_time > dt_time:
-                if prev_exact:
+                if prev_exact is not None:
                     return prev_exact
                 # In the gap.
-                if dt.fold == 0:
-                    return prev_transition
-                else:
-                    return transition
+                return transition
 
             prev_transition = transition
 
@@ -508,25 +590,55 @@ class ZoneProcessor:
         because the interval spans at least 3 whole years, and potentially 4
         years for the 'most recent prior year'.
         """
+        debug = self.debug
         # The 'eras' is defined for both Zones and Links.
         zone_eras = self.zone_info.get('eras')
         assert zone_eras is not None
 
+        # The UNTIL fields of the ZoneEras are sorted, so the eras which
+        # overlap [start_ym, until_ym) form a contiguous slice that can be
+        # found by a binary search over their packed until keys. The interval
+        # of Era[i] is [Era[i-1].UNTIL, Era[i].UNTIL), so Era[i] overlaps if
+        # until_key[i-1] < until_ym and until_key[i] > start_ym.
+        until_date_times, until_keys = _get_era_untils(zone_eras)
+        start_key = _year_month_to_key(start_ym.y, start_ym.M)
+        until_key = _year_month_to_key(until_ym.y, until_ym.M)
+        begin = bisect_right(until_keys, start_key)
+        end = bisect_left(until_keys, until_key) + 1
+
+        # Each MatchingEra spans [prev_era.UNTIL, era.UNTIL), truncated at the
+        # low and high end by start_ym and until_ym. The start_date_time uses
+        # the UTC offset of the *previous* era, so the start_date_time and
+        # until_date_time are accurate to a resolution of one day. This is good
+        # enough to generate Transitions, which also will have dateTime fields
+        # accurate to within a day or so, assuming we don't have 2 DST
+        # transitions in a single day. See _fix_transition_times() which
+        # normalizes these start times to the wall time uniformly.
+        #
+        # The binary search above determines the truncation. Only the first
+        # era has a prev_era.UNTIL (or the earliest possible time) at or before
+        # start_ym, so it is truncated to start_ym. Only the last era can have
+        # an UNTIL after until_ym, which is detected by comparing the packed
+        # keys; the 'w' suffix of until_ym is the largest suffix, so an equal
+        # key is never after it.
+        left_boundary = DateTuple(y=start_ym.y, M=start_ym.M, d=1, ss=0, f='w')
+        right_boundary = DateTuple(y=until_ym.y, M=until_ym.M, d=1, ss=0, f='w')
         prev_match: Optional[MatchingEra] = None
         matches: List[MatchingEra] = []
-        for zone_era in zone_eras:
-            if _era_overlaps_interval(
-                prev_match.zone_era if prev_match else None,
-                zone_era,
-                start_ym,
-                until_ym,
-            ):
-                match = self._create_match(
-                    prev_match, zone_era, start_ym, until_ym)
-                if self.debug:
-                    logging.info('_find_matches(): %s', match)
-                matches.append(match)
-                prev_match = match
+        for i in range(begin, min(end, len(zone_eras))):
+            match = MatchingEra(
+                start_date_time=(
+                    until_date_times[i - 1] if prev_match else left_boundary),
+                until_date_time=(
+                    right_boundary if until_keys[i] > until_key
+                    else until_date_times[i]),
+                zone_era=zone_eras[i],
+                prev_match=prev_match,
+            )
+            if debug:
+                logging.info('_find_matches(): %s', match)
+            matches.append(match)
+            prev_match = match
         return matches
 
     def _create_transitions(self, matches: List[MatchingEra]) -> None:
@@ -572,7 +684,7 @@ class ZoneProcessor:
 
     def _create_transitions_from_named_match(self, match: MatchingEra) -> None:
         """Find the transitions of the named MatchingEra. The search for the
-        relevant Transition occurs in 3 passes:
+        relevant Transition occurs in 2 passes:
 
         1. Find the candidate Transitions defined by the MatchingEra using the
            *whole* years of the MatchingEra (i.e. ignoring the month, day, and
@@ -582,20 +694,21 @@ class ZoneProcessor:
             * This pass includes something called the "most recent prior"
               Transition, because we need to know the Transition that occurred
               just before the beginning of the given year.
-        2. Fix the transition times.
+        2. Fix the transition times and select the Transitions which are
+           "active", in a single traversal of the candidate Transitions.
             * Convert the transition_time to the wall time ('w') of the previous
               rule's time offset.
             * If the transition times are given in standard ('s') or UTC ('u')
               time, they are normalized to 'w'.
-        3. Select the Transitions which are "active".
             * Active is determined by the entire date and time fields of
               MatchingEra (including month, day and time) fields.
         """
-        if self.debug:
+        debug = self.debug
+        if debug:
             logging.info('_create_transitions_from_named_match(): %s', match)
 
         # Pass 1: Find candidate transitions using whole years.
-        if self.debug:
+        if debug:
             logging.info(
                 '---- Pass 1: Get candidate transitions for MatchingEra')
         zone_era = match.zone_era
@@ -606,41 +719,39 @@ class ZoneProcessor:
         # assert isinstance(zone_policy, ZonePolicy)
         rules = zone_policy['rules']
         candidate_transitions = self._find_candidate_transitions(match, rules)
-        if self.debug:
+        if debug:
             print_transitions('Candidate Transitions', candidate_transitions)
-        check_transitions_sorted(policy_name, candidate_transitions)
+            # The candidates are sorted by construction in
+            # _add_transition_sorted(), so check them only when debugging.
+            check_transitions_sorted(policy_name, candidate_transitions)
         self.transition_storage.pop_transitions(len(candidate_transitions))
 
         # Pass 2: Fix the transitions times, converting 's' and 'u' into 'w'
-        # uniformly.
-        if self.debug:
-            logging.info('---- Pass 2: Fix transition times')
-        _fix_transition_times(candidate_transitions)
-        if self.debug:
-            print_transitions('Candidate Transitions', candidate_transitions)
-        check_transitions_sorted(policy_name, candidate_transitions)
-
-        # Pass 3: Select only those Transitions which overlap with the actual
-        # start and until times of the MatchingEra.
-        if self.debug:
-            logging.info('---- Pass 3: Select active transitions')
+        # uniformly, and select only those Transitions which overlap with the
+        # actual start and until times of the MatchingEra. Fixing the times
+        # does not change the transition_time, so the candidates are still
+        # sorted.
+        if debug:
+            logging.info(
+                '---- Pass 2: Fix transition times, select active transitions')
         try:
-            transitions = self._select_active_transitions(candidate_transitions)
+            transitions = self._select_active_transitions(
+                candidate_transitions, match)
         except:  # noqa: E722
             logging.exception(
                 "Zone '%s'; year '%04d'",
                 self.zone_info['name'],
                 self.year)
             raise
-        if self.debug:
+        if debug:
             print_transitions('Active Transitions', transitions)
 
-        # Pass 4: Verify that the "most recent prior" Transition is properly
+        # Pass 3: Verify that the "most recent prior" Transition is properly
         # sorted.
-        if self.debug:
-            logging.info('---- Pass 4: Final check for sorted transitions')
+        if debug:
+            logging.info('---- Pass 3: Final check for sorted transitions')
         check_transitions_sorted(policy_name, transitions)
-        if self.debug:
+        if debug:
             print_transitions('Active Sorted Transition', transitions)
 
         # Save the last transition of the current MatchingEra.
@@ -659,65 +770,6 @@ class ZoneProcessor:
         for t in self.transitions:
             logging.info(t)
 
-    @staticmethod
-    def _create_match(
-        prev_match: Optional[MatchingEra],
-        zone_era: ZoneEra,
-        start_ym: YearMonthTuple,
-        until_ym: YearMonthTuple,
-    ) -> MatchingEra:
-        """Create the Zone Match object for the given Zone Era, truncated at
-        the low and high end by start_ym and until_ym:
-
-        * MatchingEra.start_date_time is prev_era.until_time
-        * MatchingEra.until_date_time is zone_era.until_time
-        * MatchingEra.policy_name is '-', ':' or the string name of ZonePolicy
-
-        The start_date_time of the current MatchingEra is determined by the
-        UNTIL datetime of the prev_era, which uses the UTC offset of the
-        *previous* era, not the current era. Therefore, the start_date_time and
-        until_date_time is accurate to a resolution of one day. This is good
-        enough to generate Transitions, which also will have dateTime fields
-        accurate to within a day or so, assuming we don't have 2 DST transitions
-        in a single day.
-
-        See _fix_transition_times() which normalizes these start times to the
-        wall time uniformly.
-
-        A value of `prev_era==None` means the earliest possible ZoneEra.
-        """
-        if prev_match is None:
-            start_date_time = DateTuple(
-                y=MIN_YEAR, M=1, d=1, ss=0, f='w')
-        else:
-            prev_era = prev_match.zone_era
-            start_date_time = DateTuple(
-                y=prev_era['until_year'],
-                M=prev_era['until_month'],
-                d=prev_era['until_day'],
-                ss=prev_era['until_seconds'],
-                f=prev_era['until_time_suffix'])
-        left_boundary = DateTuple(y=start_ym.y, M=start_ym.M, d=1, ss=0, f='w')
-        if start_date_time < left_boundary:
-            start_date_time = left_boundary
-
-        until_date_time = DateTuple(
-            y=zone_era['until_year'],
-            M=zone_era['until_month'],
-            d=zone_era['until_day'],
-            ss=zone_era['until_seconds'],
-            f=zone_era['until_time_suffix'])
-        right_boundary = DateTuple(y=until_ym.y, M=until_ym.M, d=1, ss=0, f='w')
-        if until_date_time > right_boundary:
-            until_date_time = right_boundary
-
-        return MatchingEra(
-            start_date_time=start_date_time,
-            until_date_time=until_date_time,
-            zone_era=zone_era,
-            prev_match=prev_match,
-        )
-
     @staticmethod
     def _generate_start_until_times(transitions: List[Transition]) -> None:
         """Calculate the various start and until times of the Transitions in the
@@ -743,11 +795,16 @@ class ZoneProcessor:
 
         # As before, bootstrap the prev transition with the first transition
         # so that we have a UTC offset to work with.
+        # Only the total UTC offset of the previous Transition is needed, so
+        # keep that in a local variable.
         prev = transitions[0]
+        prev_total_offset_seconds = prev.offset_seconds + prev.delta_seconds
         is_after_first = False
         for transition in transitions:
             # Transition time using the wall time of the previous Transition.
             tt = transition.transition_time_w
+            total_offset_seconds = (
+                transition.offset_seconds + transition.delta_seconds)
 
             # 1) Update the 'until_date_time' of the previous Transition.
             if is_after_first:
@@ -757,14 +814,14 @@ class ZoneProcessor:
             # transition time into the current UTC offset. This algorithm should
             # be able to handle transition time of 24:00 (or even 25:00) of the
             # previous day.
-            secs = (tt.ss - prev.offset_seconds - prev.delta_seconds
-                    + transition.offset_seconds + transition.delta_seconds)
+            secs = tt.ss - prev_total_offset_seconds + total_offset_seconds
             # If (secs < 0 or secs >= 24 * 60 * 60), then we shifted into a
             # different day. During debugging, it was useful to know that, but
             # not so useful in production code, so don't print anything.
-            st = datetime(tt.y, tt.M, tt.d)
-            st += timedelta(seconds=secs)
-            transition.start_date_time = datetime_to_datetuple(st, tt.f)
+            days, ss = divmod(secs, 86400)
+            days += _days_from_civil(tt.y, tt.M, tt.d)
+            y, M, d = civil_from_days(days)
+            transition.start_date_time = DateTuple(y=y, M=M, d=d, ss=ss, f=tt.f)
 
             # 3) The epochSecond of the 'transition_time' is determined by the
             # UTC offset of the *previous* Transition. However, the
@@ -777,14 +834,14 @@ class ZoneProcessor:
             # `st` object into a timezone-aware `st` object at that fixed
             # `timezone`. But this bring in the only dependency to the Python
             # `timezone` class which is unnecessary because we can calculate the
-            # epoch seconds directly.
-            total_offset_seconds = (
-                transition.offset_seconds + transition.delta_seconds)
-            dt = st - timedelta(seconds=total_offset_seconds)  # dt now in UTC
-            epoch_second = int((dt - ACETIME_EPOCH).total_seconds())
+            # epoch seconds directly from the days since the Unix epoch.
+            epoch_second = (
+                (days - DAYS_SINCE_UNIX_EPOCH) * 86400 + ss
+                - total_offset_seconds)
             transition.start_epoch_second = epoch_second
 
             prev = transition
+            prev_total_offset_seconds = total_offset_seconds
             is_after_first = True
 
         # Finally, fix the last transition's until time
@@ -795,6 +852,12 @@ class ZoneProcessor:
         )
         transition.until_date_time = udt
 
+        # Cache the packed keys of the final start and until times for
+        # _find_transition_for_datetime().
+        for transition in transitions:
+            transition.start_key = date_tuple_to_key(transition.start_date_time)
+            transition.until_key = date_tuple_to_key(transition.until_date_time)
+
     @staticmethod
     def _calc_abbrev(transitions: List[Transition]) -> None:
         """Calculate the time zone abbreviations for each Transition.
@@ -809,27 +872,25 @@ class ZoneProcessor:
             abbreviation in the form of [+/-][hh[mm[ss]]]
         """
         for transition in transitions:
-            format = transition.format
-
-            if format == '%z':
-                abbrev = seconds_to_abbrev(transition.total_seconds)
-            else:
-                index = format.find('/')
-                if index >= 0:
-                    delta_seconds = transition.delta_seconds
-                    if delta_seconds == 0:
-                        abbrev = format[:index]
-                    else:
-                        abbrev = format[index + 1:]
-                elif format.find('%s') >= 0:
-                    letter = transition.letter
-                    if letter == '-':
-                        letter = ''
-                    abbrev = format % letter
+            (mode, std_abbrev, dst_abbrev) = _get_format_mode(
+                transition.format)
+            if mode == FORMAT_MODE_LITERAL:
+                transition.abbrev = std_abbrev
+            elif mode == FORMAT_MODE_SLASH:
+                if transition.delta_seconds == 0:
+                    transition.abbrev = std_abbrev
                 else:
-                    abbrev = format
-
-            transition.abbrev = abbrev
+                    transition.abbrev = dst_abbrev
+            elif mode == FORMAT_MODE_LETTER:
+                letter = transition.letter
+                if letter == '-':
+                    letter = ''
+                # There are only a handful of distinct abbreviations, so share
+                # a single string object for each one across all Transitions.
+                transition.abbrev = sys.intern(std_abbrev % letter)
+            else:
+                transition.abbrev = sys.intern(
+                    seconds_to_abbrev(transition.total_seconds))
 
     def _find_candidate_transitions(
         self,
@@ -840,6 +901,7 @@ class ZoneProcessor:
         obviously non-candidates. This reduces the size of the statically
         allocated Transitions array in the C++ implementation.
         """
+        debug = self.debug
         # If MatchEra.until_date_time is exactly Jan 1 00:00, set the end_year
         # to the prior year to avoid pulling Transitions in the next year which
         # do not need to be examined.
@@ -849,16 +911,37 @@ class ZoneProcessor:
         if until.M == 1 and until.d == 1 and until.ss == 0:
             end_y -= 1
 
-        # Reserve prior Transition.
-        prior_transition: Optional[Transition] = None
+        # Reserve prior Transition. The prior candidate is tracked only by its
+        # transition time and ZoneRule, so that a Transition object is created
+        # only for candidates which are actually kept. Free agents which are
+        # discarded are never allocated, but they are still counted in the
+        # TransitionStorage to match the buffer size of the C++ code.
+        prior_time: Optional[DateTuple] = None
+        prior_rule: Optional[ZoneRule] = None
         self.transition_storage.push_transitions(1)
 
+        # Month limits of the fuzzy comparison of the transition time with
+        # the match, performed within at least one month of the match.start
+        # and match.until. Unlike _compare_transition_to_match(), it does not
+        # need the transition time to be fixed by _fix_transition_times(), so
+        # it can filter out non-candidates before a Transition is created. An
+        # exact match cannot be detected this way.
+        prior_month_limit = match.start_month_index - 1
+        future_month_limit = match.until_month_index + 2
+
         transitions: List[Transition] = []
-        for rule in rules:
-            from_year = rule['from_year']
-            to_year = rule['to_year']
+        keys: List[int] = []  # day keys of 'transitions'
+        for compiled_rule in _get_compiled_rules(rules):
+            # A rule which starts after the match has neither interior years
+            # nor a prior year, so it cannot produce a candidate.
+            from_year = compiled_rule.from_year
+            if from_year > end_y:
+                continue
+            to_year = compiled_rule.to_year
+            rule = compiled_rule.rule
+
             years = _get_interior_years(from_year, to_year, start_y, end_y)
-            if self.debug:
+            if debug:
                 logging.info(
                     '_find_candidate_transitions(): '
                     '[%s,%s]: interior years: %s',
@@ -867,110 +950,130 @@ class ZoneProcessor:
             # Examine transitions in the interior years. Keep track of potential
             # prior transition.
             for year in years:
-                transition = _create_transition_for_year(year, rule, match)
+                transition_time = _get_transition_time(year, compiled_rule)
                 self.transition_storage.push_transitions(1)  # free agent
                 # Use fuzzy check to filter out transitions which cannot be
                 # candidates.
-                comp = _compare_transition_to_match_fuzzy(transition, match)
-                if comp == MATCH_STATUS_PRIOR:
-                    prior_transition = self._select_prior_transition(
-                        prior_transition, transition)
+                month_index = 12 * year + transition_time.M
+                if month_index < prior_month_limit:  # MATCH_STATUS_PRIOR
+                    # Select the latest prior transition.
+                    if prior_time is None or transition_time > prior_time:
+                        prior_time = transition_time
+                        prior_rule = rule
                     # Free agent replaces prior transition.
                     self.transition_storage.pop_transitions(1)
-                elif comp == MATCH_STATUS_WITHIN_MATCH:
-                    # Free agent becomes a candidate transition, so no need
-                    # to update the TransitionStorage buffer size.
-                    _add_transition_sorted(transitions, transition)
-                elif comp == MATCH_STATUS_FAR_FUTURE:
-                    # Remove free agent because it's not used. In the C++ code,
-                    # this is done implicitly, but in Python code, this must be
-                    # done explicitly.
-                    self.transition_storage.pop_transitions(1)
+                elif month_index < future_month_limit:
+                    # MATCH_STATUS_WITHIN_MATCH: Free agent becomes a
+                    # candidate transition, so no need to update the
+                    # TransitionStorage buffer size.
+                    _add_transition_sorted(
+                        transitions,
+                        keys,
+                        _create_transition(transition_time, rule, match),
+                        _date_tuple_to_day_key(transition_time),
+                    )
                 else:
-                    raise Exception(f"Invalid MATCH_STATUS {comp}")
+                    # MATCH_STATUS_FAR_FUTURE: Remove free agent because it's
+                    # not used. In the C++ code, this is done implicitly, but in
+                    # Python code, this must be done explicitly.
+                    self.transition_storage.pop_transitions(1)
 
             # Explicitly examine the transition of the prior year and compare
             # it with the other candidate prior transitions from above.
             prior_year = _get_most_recent_prior_year(
                 from_year, to_year, start_y, end_y)
-            if self.debug:
+            if debug:
                 logging.info('_find_candidate_transitions(): prior year: %s',
                              prior_year)
             if prior_year != INVALID_YEAR:
-                transition = _create_transition_for_year(
-                    prior_year, rule, match)
                 self.transition_storage.push_transitions(1)
-                prior_transition = self._select_prior_transition(
-                    prior_transition, transition)
+                # The transition time of the prior year can replace the prior
+                # candidate only if it is not in an earlier year, so skip
+                # computing it otherwise.
+                if prior_time is None or prior_year >= prior_time.y:
+                    transition_time = _get_transition_time(
+                        prior_year, compiled_rule)
+                    if prior_time is None or transition_time > prior_time:
+                        prior_time = transition_time
+                        prior_rule = rule
                 self.transition_storage.pop_transitions(1)
 
         # Add the most recent prior transition if it exists. Otherwise, we need
         # to remove the reserved prior transition to match the buffer size of
         # the C++ code. The C++ code does this implicitly.
-        if prior_transition:
-            _add_transition_sorted(transitions, prior_transition)
+        if prior_time is not None:
+            assert prior_rule is not None
+            _add_transition_sorted(
+                transitions,
+                keys,
+                _create_transition(prior_time, prior_rule, match),
+                _date_tuple_to_day_key(prior_time),
+            )
         else:
             self.transition_storage.pop_transitions(1)
 
         return transitions
 
-    @staticmethod
-    def _select_prior_transition(
-        prior_transition: Optional[Transition],
-        transition: Transition,
-    ) -> Transition:
-        """Select the latest prior transition given the previous prior
-        transition and the current transition.
-        """
-        if prior_transition:
-            if transition.transition_time > prior_transition.transition_time:
-                return transition
-            else:
-                return prior_transition
-        else:
-            return transition
-
     def _select_active_transitions(
         self,
         transitions: List[Transition],
+        match: MatchingEra,
     ) -> List[Transition]:
-        """Determine the active Transisitions using the match_status field.
-        The final result is returned in a new 'active_transitions' list, but in
-        the C++ version, we can avoid allocating an extra array by filter on the
-        'match_status' flag and resizing the transitions array.
+        """Fix the transition times of the candidate 'transitions' (see
+        _fix_transition_times()), and determine the active Transisitions using
+        the match_status field, in the same loop. All 'transitions' were
+        generated from the given 'match'. The final result is returned in a new
+        'active_transitions' list, but in the C++ version, we can avoid
+        allocating an extra array by filter on the 'match_status' flag and
+        resizing the transitions array.
         """
         if self.debug:
             logging.info('_select_active_transitions()')
 
+        # Bootstrap the UTC offsets with the first transition, as in
+        # _fix_transition_times().
+        prev_offset_seconds = transitions[0].offset_seconds
+        prev_delta_seconds = transitions[0].delta_seconds
+        # Build the list of active Transitions in the same loop. At most one
+        # Transition is the 'prior' at any time, and it can be invalidated by a
+        # later Transition, so it is kept aside along with the number of active
+        # Transitions which precede it, and inserted at the end.
+        active_transitions: List[Transition] = []
         prior: Optional[Transition] = None
+        prior_index = 0
         for transition in transitions:
-            prior = _process_transition_match_status(transition, prior)
+            _fix_transition_time(
+                transition, prev_offset_seconds, prev_delta_seconds)
+            prev_offset_seconds = transition.offset_seconds
+            prev_delta_seconds = transition.delta_seconds
+            prior = _process_transition_match_status(transition, match, prior)
+            if transition.match_status == MATCH_STATUS_WITHIN_MATCH:
+                active_transitions.append(transition)
+            elif prior is transition:
+                prior_index = len(active_transitions)
 
-        if prior:
+        if prior is not None:
             # Replace the transition_time with the MatchingEra's start_date_time
             # because start_date_time uses the UTC offset of the previous
             # MatchingEra, which is how we want to interpret the transition time
             # of the prior transition.
             prior.original_transition_time = prior.transition_time
-            prior.transition_time = prior.matching_era.start_date_time
+            prior.transition_time = match.start_date_time
+            active_transitions.insert(prior_index, prior)
 
-        active_transitions = []
-        for transition in transitions:
-            if _match_status_is_active(transition.match_status):
-                active_transitions.append(transition)
         return active_transitions
 
 
 def _process_transition_match_status(
     transition: Transition,
+    match: MatchingEra,
     prior: Optional[Transition],
 ) -> Optional[Transition]:
-    """Determine if a transition is active with respect to the given match.
-    This assumes that all Transitions have been fixed using
-    _fix_transition_times().
+    """Determine if a transition is active with respect to the given match,
+    which is the MatchingEra that generated the transition. This assumes that
+    all Transitions have been fixed using _fix_transition_times().
     """
-    match_status = _compare_transition_to_match(
-        transition, transition.matching_era)
+    match_status = _compare_transition_to_match(transition, match)
     transition.match_status = match_status
 
     if match_status == MATCH_STATUS_EXACT_MATCH:
@@ -978,12 +1081,16 @@ def _process_transition_match_status(
         # invalidate any previous prior transition candidate. And we set the
         # current prior to this exactly matching Transition to prevent any
         # other Transition from becoming the prior.
-        if prior:
+        if prior is not None:
             prior.match_status = MATCH_STATUS_FAR_PAST
         prior = transition
     elif match_status == MATCH_STATUS_PRIOR:
-        if prior:
-            if transition.transition_time_u >= prior.transition_time_u:
+        if prior is not None:
+            # Compare the packed keys of the 'u' transition times.
+            if (
+                transition.transition_time_keys[2]
+                >= prior.transition_time_keys[2]
+            ):
                 prior.match_status = MATCH_STATUS_FAR_PAST
                 prior = transition
             else:
@@ -993,122 +1100,176 @@ def _process_transition_match_status(
     return prior
 
 
-def _era_overlaps_interval(
-    prev_era: Optional[ZoneEra],
-    era: ZoneEra,
-    start_ym: YearMonthTuple,
-    until_ym: YearMonthTuple,
-) -> bool:
-    """Determines if era overlaps the interval [start_ym, until_ym),
-    ignoring the day, time and timeSuffix. The start date of the current
-    era is represented by the prev_era.UNTIL, so the interval of the current
-    era is [start_era, until_era) = [prev_era.UNTIL, era.UNTIL). Overlap
-    happens if (start_era < until_ym) and (until_era > start_ym). A
-    'prev_era==None' means the earliest possible ZoneEra.
+_V = TypeVar('_V')
+
+
+class _IdentityCache(Generic[_V]):
+    """A cache of the values derived from an object (e.g. a list of ZoneEras,
+    or a zone_info), keyed by the id() of the object and an optional integer
+    subkey. The object is stored next to its value, which keeps it alive while
+    it is cached, and a lookup returns the value only if the stored object is
+    the given object, so a recycled id() can never return the value of a
+    different object. If max_size is given, the entries are kept in least
+    recently used order, and the oldest entry is evicted when the cache is
+    full.
     """
-    return (
-        (
-            prev_era is None
-            or _compare_era_to_year_month(prev_era, until_ym.y, until_ym.M) < 0
-        )
-        and _compare_era_to_year_month(era, start_ym.y, start_ym.M) > 0
-    )
 
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size
+        self.entries: Dict[Tuple[int, int], Tuple[object, _V]] = {}
 
-def _compare_era_to_year_month(
-    era: ZoneEra,
-    year: int,
-    month: int,
-) -> int:
-    """Compare the zone_era with year, returning -1, 0 or 1. The day of
-    month is implicitly 1. Ignore the until_time_suffix suffix. Maybe it's
-    not needed in this context?
+    def get(self, obj: object, subkey: int = 0) -> Optional[_V]:
+        key = (id(obj), subkey)
+        entry = self.entries.get(key)
+        if entry is None or entry[0] is not obj:
+            return None
+        if self.max_size is not None:
+            # Move to most recently used.
+            del self.entries[key]
+            self.entries[key] = entry
+        return entry[1]
+
+    def put(self, obj: object, value: _V, subkey: int = 0) -> None:
+        key = (id(obj), subkey)
+        self.entries.pop(key, None)
+        if self.max_size is not None and len(self.entries) >= self.max_size:
+            del self.entries[next(iter(self.entries))]
+        self.entries[key] = (obj, value)
+
+
+# Cache of the UNTIL fields of each list of ZoneEras.
+_ERA_UNTILS: _IdentityCache[Tuple[List[DateTuple], List[int]]] = \
+    _IdentityCache()
+
+
+def _get_era_untils(
+    zone_eras: List[ZoneEra],
+) -> Tuple[List[DateTuple], List[int]]:
+    """Return 2 lists parallel to 'zone_eras', the UNTIL fields of each ZoneEra
+    as a DateTuple, and the packed key of that DateTuple (ignoring the
+    until_time_suffix), which can be compared to
+    _year_month_to_key(year, month). The lists are computed once for each list
+    of ZoneEras and shared by all ZoneProcessor instances, so that
+    _find_matches() does not read the UNTIL fields from each ZoneEra dict on
+    every call.
     """
-    if era['until_year'] < year: return -1  # noqa: E701
-    if era['until_year'] > year: return 1  # noqa: E701
-    if era['until_month'] < month: return -1  # noqa: E701
-    if era['until_month'] > month: return 1  # noqa: E701
-    if era['until_day'] > 1: return 1  # noqa: E701
-    if era['until_seconds'] < 0: return -1  # noqa: E701
-    if era['until_seconds'] > 0: return 1  # noqa: E701
-    return 0
+    entry = _ERA_UNTILS.get(zone_eras)
+    if entry is not None:
+        return entry
+    until_date_times = [
+        DateTuple(
+            y=era['until_year'],
+            M=era['until_month'],
+            d=era['until_day'],
+            ss=era['until_seconds'],
+            f=era['until_time_suffix'],
+        )
+        for era in zone_eras
+    ]
+    until_keys = [date_tuple_to_key(dt) for dt in until_date_times]
+    _ERA_UNTILS.put(zone_eras, (until_date_times, until_keys))
+    return until_date_times, until_keys
+
+
+def _year_month_to_key(year: int, month: int) -> int:
+    """Return the packed key of 00:00 on the first day of year/month."""
+    return date_tuple_to_key(DateTuple(y=year, M=month, d=1, ss=0, f='w'))
 
 
 def _add_transition_sorted(
         transitions: List[Transition],
+        keys: List[int],
         transition: Transition,
+        key: int,
 ) -> None:
-    """Add the transition to the transitions array, using an Insertion Sort
-    algorithm, so that 'transitions' array is always sorted by transition_time.
+    """Add the transition to the transitions array, so that 'transitions' array
+    is always sorted by the date of its transition_time. The 'keys' list is
+    parallel to 'transitions' and holds the _date_tuple_to_day_key() of each
+    transition_time, and 'key' is the day key of the new 'transition'.
 
     In normal Python code, we would accumulate the unsorted 'transitions' list,
     then call 'sort()` after all the elements have been added. But this code is
-    emulating the equivalent Arduino C++ code without without dynamic arrays and
-    a sort() function. By using an incremental Insertion Sort algorithm, we can
-    convert this into C++ more easily. The O(N^2) Insertion Sort algorithm
-    should be more than fast enough since N <= ~7 (up to 4 interior transitions,
-    plus 1 in Jan of the current year, plus 1 in Jan of the following year, and
-    1 most recent prior transition.)
+    emulating the equivalent Arduino C++ code, which uses an incremental
+    Insertion Sort without dynamic arrays and a sort() function. Here, the
+    insertion point is found with a binary search on the 'keys' list instead of
+    comparing the DateTuples in a Python loop. N <= ~7 (up to 4 interior
+    transitions, plus 1 in Jan of the current year, plus 1 in Jan of the
+    following year, and 1 most recent prior transition.)
+
+    A transition with the same date as an existing one is inserted after it,
+    like the Insertion Sort.
     """
-    transitions.append(transition)
-    for i in range(len(transitions) - 1, 0, -1):
-        curr = transitions[i]
-        prev = transitions[i - 1]
-        if _compare_date_tuple(curr.transition_time, prev.transition_time) < 0:
-            transitions[i - 1] = curr
-            transitions[i] = prev
+    i = bisect_right(keys, key)
+    keys.insert(i, key)
+    transitions.insert(i, transition)
 
 
-def _compare_date_tuple(a: DateTuple, b: DateTuple) -> int:
-    if a.y < b.y: return -1  # noqa: E701
-    if a.y > b.y: return 1  # noqa: E701
-    if a.M < b.M: return -1  # noqa: E701
-    if a.M > b.M: return 1  # noqa: E701
-    if a.d < b.d: return -1  # noqa: E701
-    if a.d > b.d: return 1  # noqa: E701
-    return 0
+def _date_tuple_to_day_key(dt: DateTuple) -> int:
+    """Pack the (y, M, d) fields of the DateTuple into a single int, ignoring
+    the 'ss' and 'f' fields. These keys sort in the same order as the dates.
+    """
+    return (dt.y * 16 + dt.M) * 32 + dt.d
 
 
-def _expand_date_tuple(
+def _expand_seconds(
     dt: DateTuple,
     offset_seconds: int,
     delta_seconds: int,
-) -> Tuple[DateTuple, DateTuple, DateTuple]:
-    """Convert 's', 'u', or 'w' time into the other 2 versions using the
-    given base UTC offset and the delta DST offset. Return a tuple of
-    *normalized* (wall, standard, utc) date tuples. The dates are normalized
-    so that transitions occurring at 24:00:00 is moved to the next day.
+) -> Tuple[int, int, int]:
+    """Return the seconds fields of the (wall, standard, utc) versions of 'dt'
+    using the given base UTC offset and the delta DST offset, relative to the
+    date of 'dt', without normalizing them.
     """
     delta_seconds = delta_seconds if delta_seconds else 0
     offset_seconds = offset_seconds if offset_seconds else 0
 
-    if dt.f == 'w':
-        dtw = dt
-        dts = DateTuple(
-            y=dt.y, M=dt.M, d=dt.d, ss=dtw.ss - delta_seconds, f='s')
-        ss = dtw.ss - delta_seconds - offset_seconds
-        dtu = DateTuple(y=dt.y, M=dt.M, d=dt.d, ss=ss, f='u')
-    elif dt.f == 's':
-        dts = dt
-        dtw = DateTuple(
-            y=dt.y, M=dt.M, d=dt.d, ss=dts.ss + delta_seconds, f='w')
-        dtu = DateTuple(
-            y=dt.y, M=dt.M, d=dt.d, ss=dts.ss - offset_seconds, f='u')
-    elif dt.f == 'u':
-        dtu = dt
-        ss = dtu.ss + delta_seconds + offset_seconds
-        dtw = DateTuple(y=dtu.y, M=dtu.M, d=dtu.d, ss=ss, f='w')
-        dts = DateTuple(
-            y=dtu.y, M=dtu.M, d=dtu.d, ss=dtu.ss + offset_seconds, f='s')
+    ss = dt.ss
+    f = dt.f
+    if f == 'w':
+        sss = ss - delta_seconds
+        return (ss, sss, sss - offset_seconds)
+    elif f == 's':
+        return (ss + delta_seconds, ss, ss - offset_seconds)
+    elif f == 'u':
+        sss = ss + offset_seconds
+        return (sss + delta_seconds, sss, ss)
     else:
         logging.error("Unrecognized Rule.AT suffix '%s'; date=%s", dt.f, dt)
         sys.exit(1)
 
-    dtw = normalize_date_tuple(dtw)
-    dts = normalize_date_tuple(dts)
-    dtu = normalize_date_tuple(dtu)
 
-    return (dtw, dts, dtu)
+def _expand_date_tuple(
+    dt: DateTuple,
+    offset_seconds: int,
+    delta_seconds: int,
+) -> Tuple[DateTuple, DateTuple, DateTuple]:
+    """Convert 's', 'u', or 'w' time into the other 2 versions using the
+    given base UTC offset and the delta DST offset. Return a tuple of
+    *normalized* (wall, standard, utc) date tuples. The dates are normalized
+    so that transitions occurring at 24:00:00 is moved to the next day.
+    """
+    (y, M, d, ss, f) = dt
+    (ssw, sss, ssu) = _expand_seconds(dt, offset_seconds, delta_seconds)
+
+    # Most transitions stay within the same day in all 3 versions, so the
+    # DateTuples are already normalized.
+    if (
+        y != MIN_YEAR
+        and 0 <= ssw < 86400
+        and 0 <= sss < 86400
+        and 0 <= ssu < 86400
+    ):
+        return (
+            dt if f == 'w' else DateTuple(y, M, d, ssw, 'w'),
+            DateTuple(y, M, d, sss, 's'),
+            DateTuple(y, M, d, ssu, 'u'),
+        )
+
+    return (
+        normalize_date_tuple(DateTuple(y, M, d, ssw, 'w')),
+        normalize_date_tuple(DateTuple(y, M, d, sss, 's')),
+        normalize_date_tuple(DateTuple(y, M, d, ssu, 'u')),
+    )
 
 
 def _fix_transition_times(transitions: List[Transition]) -> None:
@@ -1130,36 +1291,169 @@ def _fix_transition_times(transitions: List[Transition]) -> None:
     # Bootstrap the transition with the first transition, effectively
     # extending the first transition backwards to -infinity. This won't be
     # 100% correct with respect to the TZ Database but it will be good
-    # enough for the first transition that we care about.
-    prev = transitions[0].copy()
+    # enough for the first transition that we care about. Only the UTC offsets
+    # of the previous transition are needed, so keep those in local variables.
+    prev_offset_seconds = transitions[0].offset_seconds
+    prev_delta_seconds = transitions[0].delta_seconds
     for transition in transitions:
-        (
-            transition.transition_time_w,
-            transition.transition_time_s,
-            transition.transition_time_u,
-        ) = _expand_date_tuple(
-            transition.transition_time,
-            prev.offset_seconds,
-            prev.delta_seconds,
-        )
-        prev = transition
+        _fix_transition_time(
+            transition, prev_offset_seconds, prev_delta_seconds)
+        prev_offset_seconds = transition.offset_seconds
+        prev_delta_seconds = transition.delta_seconds
 
 
-def _create_transition_for_year(
-    year: int,
+def _fix_transition_time(
+    transition: Transition,
+    prev_offset_seconds: int,
+    prev_delta_seconds: int,
+) -> None:
+    """Set the transition_time_w field of a single Transition, and the packed
+    int keys of its 'w', 's' and 'u' versions, using the UTC offsets of the
+    previous Transition. See _fix_transition_times().
+    """
+    tt = transition.transition_time
+    (y, M, d, ss, f) = tt
+    (ssw, sss, ssu) = _expand_seconds(
+        tt, prev_offset_seconds, prev_delta_seconds)
+
+    # Most transitions stay within the same day in all 3 versions. Then only the
+    # 'w' version needs a DateTuple, and the packed keys (see
+    # date_tuple_to_key()) of all 3 share the same date. The 's' and 'u'
+    # versions are decoded from their keys if they are ever needed.
+    if (
+        y != MIN_YEAR
+        and 0 <= ssw < 86400
+        and 0 <= sss < 86400
+        and 0 <= ssu < 86400
+    ):
+        transition.transition_time_w = (
+            tt if f == 'w' else DateTuple(y, M, d, ssw, 'w'))
+        day_key = (((y * 16 + M) * 32 + d) << 20) + 0x80000
+        transition.transition_time_keys = (
+            day_key + ssw, day_key + sss, day_key + ssu)
+        return
+
+    (ttw, tts, ttu) = _expand_date_tuple(
+        tt, prev_offset_seconds, prev_delta_seconds)
+    transition.transition_time_w = ttw
+    transition.transition_time_keys = (
+        date_tuple_to_key(ttw),
+        date_tuple_to_key(tts),
+        date_tuple_to_key(ttu),
+    )
+
+
+def _create_transition(
+    transition_time: DateTuple,
     rule: ZoneRule,
     match: MatchingEra,
 ) -> Transition:
-    """Create the transition from the given 'rule' for the given 'year'.
-    Transition object is a replica of the underlying Match object, with
-    additional bookkeeping info.
+    """Create the transition from the given 'rule' at its 'transition_time'
+    (from _get_transition_time()) for a particular year. Transition object is a
+    replica of the underlying Match object, with additional bookkeeping info.
     """
-    transition = Transition(
+    return Transition(
         matching_era=match,
-        transition_time=_get_transition_time(year, rule),
+        transition_time=transition_time,
+        zone_rule=rule,
     )
-    transition.zone_rule = rule
-    return transition
+
+
+# Kinds of ZoneEra.format strings, see _get_format_mode().
+FORMAT_MODE_LITERAL = 0  # 'EST'
+FORMAT_MODE_SLASH = 1  # 'GMT/BST'
+FORMAT_MODE_LETTER = 2  # 'E%sT'
+FORMAT_MODE_OFFSET = 3  # '%z'
+
+# Cache of the parsed ZoneEra.format strings, keyed by the format string.
+_FORMAT_MODES: Dict[str, Tuple[int, str, str]] = {}
+
+
+def _get_format_mode(format: str) -> Tuple[int, str, str]:
+    """Return the (mode, std_abbrev, dst_abbrev) of the given ZoneEra.format.
+    For FORMAT_MODE_LITERAL and FORMAT_MODE_SLASH, the std_abbrev and
+    dst_abbrev are the abbreviations for standard and DST time. For
+    FORMAT_MODE_LETTER, the std_abbrev is the format template for the
+    'letter'. The format strings are shared by many Transitions, so each one is
+    parsed only once.
+    """
+    entry = _FORMAT_MODES.get(format)
+    if entry is not None:
+        return entry
+
+    if format == '%z':
+        entry = (FORMAT_MODE_OFFSET, '', '')
+    else:
+        index = format.find('/')
+        if index >= 0:
+            entry = (
+                FORMAT_MODE_SLASH,
+                sys.intern(format[:index]),
+                sys.intern(format[index + 1:]),
+            )
+        elif format.find('%s') >= 0:
+            entry = (FORMAT_MODE_LETTER, format, format)
+        else:
+            abbrev = sys.intern(format)
+            entry = (FORMAT_MODE_LITERAL, abbrev, abbrev)
+    _FORMAT_MODES[format] = entry
+    return entry
+
+
+# Maximum number of (zone_info, year) entries in _SHARED_YEAR_CACHE.
+SHARED_YEAR_CACHE_SIZE = 256
+
+# Cache of the init_for_year() results shared by all ZoneProcessor instances,
+# keyed by the zone_info and the year. The MatchingEras and Transitions are not
+# modified after init_for_year() completes, so they can be shared safely.
+_SHARED_YEAR_CACHE: _IdentityCache[YearCacheEntry] = \
+    _IdentityCache(SHARED_YEAR_CACHE_SIZE)
+
+
+class CompiledZoneRule(NamedTuple):
+    """The fields of a ZoneRule which are needed by
+    _find_candidate_transitions() and _get_transition_time(), unpacked from
+    the ZoneRule dict, along with the original 'rule'.
+    """
+    rule: ZoneRule
+    from_year: int
+    to_year: int
+    in_month: int
+    on_day_of_week: int
+    on_day_of_month: int
+    at_seconds: int
+    at_time_suffix: str
+
+
+# Cache of the CompiledZoneRule records of each list of ZoneRules.
+_COMPILED_RULES: _IdentityCache[List[CompiledZoneRule]] = _IdentityCache()
+
+
+def _get_compiled_rules(rules: List[ZoneRule]) -> List[CompiledZoneRule]:
+    """Return the list of CompiledZoneRule records of the given 'rules'. The
+    records are created once for each list of ZoneRules and shared by all
+    ZoneProcessor instances, so that the inner loops of
+    _find_candidate_transitions() read tuple fields instead of performing dict
+    lookups per rule per year.
+    """
+    entry = _COMPILED_RULES.get(rules)
+    if entry is not None:
+        return entry
+    compiled_rules = [
+        CompiledZoneRule(
+            rule=rule,
+            from_year=rule['from_year'],
+            to_year=rule['to_year'],
+            in_month=rule['in_month'],
+            on_day_of_week=rule['on_day_of_week'],
+            on_day_of_month=rule['on_day_of_month'],
+            at_seconds=rule['at_seconds'],
+            at_time_suffix=rule['at_time_suffix'],
+        )
+        for rule in rules
+    ]
+    _COMPILED_RULES.put(rules, compiled_rules)
+    return compiled_rules
 
 
 def _get_interior_years(
@@ -1167,14 +1461,12 @@ def _get_interior_years(
     to_year: int,
     start_year: int,
     end_year: int,
-) -> List[int]:
+) -> range:
     """Return the Rule years that overlap with the Match[start_year, end_year].
+    The overlap is always a contiguous interval of years, so it is returned
+    as a 'range', which is empty if there is no overlap.
     """
-    years = []
-    for year in range(start_year, end_year + 1):
-        if from_year <= year and year <= to_year:
-            years.append(year)
-    return years
+    return range(max(from_year, start_year), min(to_year, end_year) + 1)
 
 
 def _get_most_recent_prior_year(
@@ -1227,105 +1519,104 @@ def _compare_transition_to_match(
     _fix_transition_times().
     """
 
-    # Determine the UTC offset of the previous MatchingEra.
-    if match.prev_match:
-        prev_match = match.prev_match
-        assert prev_match.last_transition is not None
-        offset_seconds = prev_match.last_transition.offset_seconds
-        delta_seconds = prev_match.last_transition.delta_seconds
-    else:
-        # The first MatchingEra, so there is no previous Transition. Let's just
-        # take the current offset_seconds, and assume a DST offset of 0.
-        prev_match = match
-        offset_seconds = match.zone_era['offset_seconds']
-        delta_seconds = 0
-
-    # Expand the MatchingEra.start_date_time into 'w', 's' and 'u' units.
-    (stw, sts, stu) = _expand_date_tuple(
-        match.start_date_time,
-        offset_seconds,
-        delta_seconds,
-    )
+    # The (w, s, u) versions of the MatchingEra.start_date_time depend only on
+    # the 'match', so compute their packed keys once and cache them.
+    start_keys = match.start_keys
+    if start_keys is None:
+        start_keys = _calc_match_start_keys(match)
+        match.start_keys = start_keys
+    (stw_key, sts_key, stu_key) = start_keys
 
     # Determine if the Transition happens at exactly the same time as the
     # start of the MatchingEra. An exact match is considered to happen if
-    # *any* of the 'w', 's' or 'u' times match up.
+    # *any* of the 'w', 's' or 'u' times match up. The 'f' suffix is identical
+    # on both sides of each comparison, so the packed int keys can be used.
+    (transition_w_key, transition_s_key, transition_u_key) = (
+        transition.transition_time_keys)
     if (
-        transition.transition_time_u == stu
-        or transition.transition_time_w == stw
-        or transition.transition_time_s == sts
+        transition_u_key == stu_key
+        or transition_w_key == stw_key
+        or transition_s_key == sts_key
     ):
         return MATCH_STATUS_EXACT_MATCH
 
-    if transition.transition_time_u < stu:
+    if transition_u_key < stu_key:
         return MATCH_STATUS_PRIOR
 
     # Check if the transition occurs after the given 'match'. The
     # 'until_date_time' of the current match uses the same UTC offsets as the
     # transition_time of the given 'transition', so we don't have to make any
-    # complicated adjustments.
-    match_until = match.until_date_time
-    if match_until.f == 'w':
-        transition_time = transition.transition_time_w
-    elif match_until.f == 's':
-        transition_time = transition.transition_time_s
-    elif match_until.f == 'u':
-        transition_time = transition.transition_time_u
-    else:
-        raise Exception(f"Unknown suffix: {match_until.f}")
-    if match_until <= transition_time:
+    # complicated adjustments. Compare the packed int keys, since the 'f'
+    # suffix is identical on both sides.
+    until_suffix_index = match.until_suffix_index
+    if until_suffix_index < 0:
+        raise Exception(f"Unknown suffix: {match.until_date_time.f}")
+    transition_key = transition.transition_time_keys[until_suffix_index]
+    if match.until_key <= transition_key:
         return MATCH_STATUS_FAR_FUTURE
 
     return MATCH_STATUS_WITHIN_MATCH
 
 
-def _compare_transition_to_match_fuzzy(
-    transition: Transition,
-    match: MatchingEra,
-) -> int:
-    """Like _compare_transition_to_match() except perform a fuzzy match
-    within at least one-month of the match.start or match.until. This is useful
-    because unlike _compare_transition_to_match(), the Transition object does
-    not need its 'transition_time' to be "fixed" (through
-    _fix_transition_times()) to be able to use this function, so we can use this
-    function earlier in the filtering process of finding candidate transitions.
-
-    Return:
-        * MATCH_STATUS_PRIOR if less than match
-        * MATCH_STATUS_WITHIN_MATCH if within match,
-        * MATCH_STATUS_FAR_FUTURE if greater than match
-        * MATCH_STATUS_EXACT_MATCH is never returned since we cannot make a
-          direct comparison to match_start.
+def _calc_match_start_keys(match: MatchingEra) -> Tuple[int, int, int]:
+    """Return the packed int keys of the 'w', 's' and 'u' versions of the
+    match.start_date_time, using the UTC offsets of the last Transition of the
+    previous MatchingEra.
     """
-    tt = transition.transition_time
-    transition_time = 12 * tt.y + tt.M
+    # Determine the UTC offset of the previous MatchingEra.
+    if match.prev_match is not None:
+        prev_match = match.prev_match
+        assert prev_match.last_transition is not None
+        offset_seconds = prev_match.last_transition.offset_seconds
+        delta_seconds = prev_match.last_transition.delta_seconds
+    else:
+        # The first MatchingEra, so there is no previous Transition. Let's just
+        # take the current offset_seconds, and assume a DST offset of 0.
+        offset_seconds = match.zone_era['offset_seconds']
+        delta_seconds = 0
 
-    ms = match.start_date_time
-    match_start = 12 * ms.y + ms.M
-    if transition_time < match_start - 1:
-        return MATCH_STATUS_PRIOR
+    # Expand the MatchingEra.start_date_time into 'w', 's' and 'u' units.
+    (stw, sts, stu) = _expand_date_tuple(
+        match.start_date_time,
+        offset_seconds,
+        delta_seconds,
+    )
+    return (
+        date_tuple_to_key(stw),
+        date_tuple_to_key(sts),
+        date_tuple_to_key(stu),
+    )
 
-    mu = match.until_date_time
-    match_until = 12 * mu.y + mu.M
-    if match_until + 2 <= transition_time:
-        return MATCH_STATUS_FAR_FUTURE
 
-    return MATCH_STATUS_WITHIN_MATCH
+# Memoized version of calc_day_of_month(). The same arguments are computed
+# repeatedly for adjacent years and MatchingEras, and by every ZoneProcessor
+# which uses the same ZonePolicy.
+_calc_day_of_month = lru_cache(maxsize=4096)(calc_day_of_month)
+
+# Memoized version of days_from_civil(). The transition times fall on a small
+# set of (year, month, day) triples which are revisited for each year.
+_days_from_civil = lru_cache(maxsize=4096)(days_from_civil)
 
 
-def _get_transition_time(year: int, rule: ZoneRule) -> DateTuple:
+def _get_transition_time(year: int, rule: CompiledZoneRule) -> DateTuple:
     """Return the (year, month, day, seconds, suffix) of the Rule in given
     year.
     """
     if year == MIN_YEAR:
         return DateTuple(y=year, M=1, d=1, ss=0, f='w')
 
-    month, day = calc_day_of_month(
-        year,
-        rule['in_month'],
-        rule['on_day_of_week'],
-        rule['on_day_of_month']
-    )
-    seconds = rule['at_seconds']
-    suffix = rule['at_time_suffix']
-    return DateTuple(y=year, M=month, d=day, ss=seconds, f=suffix)
+    # Rules with a fixed day of month (on_day_of_week == 0) cannot shift into
+    # the previous or next month, so skip calc_day_of_month().
+    on_day_of_week = rule.on_day_of_week
+    if on_day_of_week == 0:
+        month = rule.in_month
+        day = rule.on_day_of_month
+    else:
+        month, day = _calc_day_of_month(
+            year,
+            rule.in_month,
+            on_day_of_week,
+            rule.on_day_of_month,
+        )
+    return DateTuple(
+        y=year, M=month, d=day, ss=rule.at_seconds, f=rule.at_time_suffix)
@@ -1,6 +1,10 @@
 import unittest
+from datetime import date
 
 from acetime.common import days_in_year_month
+from acetime.common import is_leap_year
+from acetime.common import civil_from_days
+from acetime.common import days_from_civil
 from acetime.common import to_epoch_seconds
 from acetime.common import to_unix_seconds
 from acetime.common import seconds_to_abbrev
@@ -14,6 +18,38 @@ class TetCommon(unittest.TestCase):
         self.assertEqual(29, days_in_year_month(2004, 2))
         self.assertEqual(28, days_in_year_month(2100, 2))  # 2100 is not leap
 
+    def test_is_leap_year(self) -> None:
+        self.assertTrue(is_leap_year(2000))
+        self.assertFalse(is_leap_year(2001))
+        self.assertTrue(is_leap_year(2004))
+        self.assertFalse(is_leap_year(2100))
+        for year in range(-800, 3201):
+            self.assertEqual(
+                (year % 4 == 0) and ((year % 100 != 0) or (year % 400 == 0)),
+                is_leap_year(year),
+            )
+
+    def test_civil_from_days_and_days_from_civil(self) -> None:
+        self.assertEqual((1970, 1, 1), civil_from_days(0))
+        self.assertEqual((1969, 12, 31), civil_from_days(-1))
+        self.assertEqual((2000, 2, 29), civil_from_days(11016))
+
+        unix_ordinal = date(1970, 1, 1).toordinal()
+        for ordinal in range(
+            date(1, 1, 1).toordinal(),
+            date(9999, 12, 31).toordinal(),
+            997,
+        ):
+            d = date.fromordinal(ordinal)
+            self.assertEqual(
+                (d.year, d.month, d.day),
+                civil_from_days(ordinal - unix_ordinal),
+            )
+            self.assertEqual(
+                ordinal - unix_ordinal,
+                days_from_civil(d.year, d.month, d.day),
+            )
+
     def test_epoch_conversions(self) -> None:
         # epoch_seconds==0 corresponds to 2050-01-01, which is
         # 2524608000 according to (date +%s -d '2050-01-01T00:00:00Z').
@@ -3,33 +3,47 @@
 # MIT License
 
 import unittest
+from datetime import datetime
 
-from acetime.date_tuple import subtract_date_tuple
+from acetime.date_tuple import date_tuple_to_key
+from acetime.date_tuple import datetime_to_key
+from acetime.date_tuple import date_tuple_to_string
+from acetime.date_tuple import datetime_to_datetuple
 from acetime.date_tuple import DateTuple
 
 
 class TestDateTuple(unittest.TestCase):
-    def test_subtract_date_tuple(self) -> None:
+    def test_date_tuple_to_key(self) -> None:
+        tuples = [
+            DateTuple(1999, 12, 31, 86400, 'w'),
+            DateTuple(2000, 1, 1, -3600, 'w'),
+            DateTuple(2000, 1, 1, 0, 'w'),
+            DateTuple(2000, 1, 1, 90000, 'w'),
+            DateTuple(2000, 1, 2, 0, 'w'),
+            DateTuple(2000, 2, 1, 0, 'w'),
+        ]
+        keys = [date_tuple_to_key(t) for t in tuples]
+        self.assertEqual(sorted(keys), keys)
+        self.assertEqual(len(set(keys)), len(keys))
         self.assertEqual(
-            -1,
-            subtract_date_tuple(
-                DateTuple(2000, 1, 1, 43, 'w'),
-                DateTuple(2000, 1, 1, 44, 'w'),
-            )
+            date_tuple_to_key(DateTuple(2000, 1, 1, 0, 's')),
+            date_tuple_to_key(DateTuple(2000, 1, 1, 0, 'u')),
         )
 
+    def test_date_tuple_to_string(self) -> None:
         self.assertEqual(
-            24 * 3600 - 1,
-            subtract_date_tuple(
-                DateTuple(2000, 1, 2, 43, 'w'),
-                DateTuple(2000, 1, 1, 44, 'w'),
-            )
-        )
+            '2000-03-26T02:30w',
+            date_tuple_to_string(DateTuple(2000, 3, 26, 9000, 'w')))
+        self.assertEqual(
+            '2000-10-29T25:00s',
+            date_tuple_to_string(DateTuple(2000, 10, 29, 90000, 's')))
+        self.assertEqual(
+            '-32767-01-01T00:00u',
+            date_tuple_to_string(DateTuple(-32767, 1, 1, 0, 'u')))
 
+    def test_datetime_to_key(self) -> None:
+        dt = datetime(2000, 3, 26, 2, 30, 15)
         self.assertEqual(
-            -31 * 24 * 3600 + 24 * 3600 - 1,
-            subtract_date_tuple(
-                DateTuple(2000, 1, 2, 43, 'w'),
-                DateTuple(2000, 2, 1, 44, 'w'),
-            )
+            date_tuple_to_key(datetime_to_datetuple(dt, 'w')),
+            datetime_to_key(dt),
         )
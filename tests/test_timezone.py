@@ -328,6 +328,21 @@ class TestLosAngeles(unittest.TestCase):
 
         self.assertEqual(dtu, dtc)
 
+    def test_lookup_info_cache_uses_fold(self) -> None:
+        """Verify that the cached lookup distinguishes the 2 datetimes in the
+        overlap which differ only by their fold.
+        """
+        tz = acetz(ZONE_INFO_America_Los_Angeles)
+        dt0 = datetime(2000, 10, 29, 1, 30, 0, tzinfo=tz, fold=0)
+        dt1 = datetime(2000, 10, 29, 1, 30, 0, tzinfo=tz, fold=1)
+        for _ in range(2):
+            self.assertEqual("PDT", dt0.tzname())
+            self.assertEqual(timedelta(hours=-7), dt0.utcoffset())
+            self.assertEqual(timedelta(hours=1), dt0.dst())
+            self.assertEqual("PST", dt1.tzname())
+            self.assertEqual(timedelta(hours=-8), dt1.utcoffset())
+            self.assertEqual(timedelta(hours=0), dt1.dst())
+
 
 class TestUSPacific(unittest.TestCase):
 
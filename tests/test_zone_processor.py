@@ -4,8 +4,11 @@
 
 import unittest
 from datetime import datetime
+from typing import List
+from typing import Optional
 
 from acetime.zonedball import zone_infos
+from acetime.common import to_epoch_seconds
 from acetime.date_tuple import YearMonthTuple
 from acetime.date_tuple import DateTuple
 from acetime.date_tuple import normalize_date_tuple
@@ -13,17 +16,65 @@ from acetime.transition import Transition
 from acetime.transition import MatchingEra
 from acetime.zone_processor import ZoneProcessor
 from acetime.zone_processor import _get_interior_years
-from acetime.zone_processor import _compare_era_to_year_month
-from acetime.zone_processor import _era_overlaps_interval
+from acetime.zone_processor import _add_transition_sorted
+from acetime.zone_processor import _date_tuple_to_day_key
+from acetime.zone_processor import _get_format_mode
+from acetime.zone_processor import _IdentityCache
 from acetime.zone_processor import _expand_date_tuple
-from acetime.zone_processor import _compare_transition_to_match_fuzzy
 from acetime.zone_processor import _compare_transition_to_match
 from acetime.zone_processor import _fix_transition_times
 from acetime.zone_processor import MATCH_STATUS_PRIOR
 from acetime.zone_processor import MATCH_STATUS_EXACT_MATCH
 from acetime.zone_processor import MATCH_STATUS_WITHIN_MATCH
 from acetime.zone_processor import MATCH_STATUS_FAR_FUTURE
+from acetime.zone_processor import FORMAT_MODE_LITERAL
+from acetime.zone_processor import FORMAT_MODE_SLASH
+from acetime.zone_processor import FORMAT_MODE_LETTER
+from acetime.zone_processor import FORMAT_MODE_OFFSET
 from acetime.typing import ZoneEra
+from acetime.typing import ZoneRule
+
+
+# Reference implementation of the era overlap rule, used to verify the binary
+# search of ZoneProcessor._find_matches().
+def _era_overlaps_interval(
+    prev_era: Optional[ZoneEra],
+    era: ZoneEra,
+    start_ym: YearMonthTuple,
+    until_ym: YearMonthTuple,
+) -> bool:
+    """Determines if era overlaps the interval [start_ym, until_ym),
+    ignoring the day, time and timeSuffix. The start date of the current
+    era is represented by the prev_era.UNTIL, so the interval of the current
+    era is [start_era, until_era) = [prev_era.UNTIL, era.UNTIL). Overlap
+    happens if (start_era < until_ym) and (until_era > start_ym). A
+    'prev_era==None' means the earliest possible ZoneEra.
+    """
+    return (
+        (
+            prev_era is None
+            or _compare_era_to_year_month(prev_era, until_ym.y, until_ym.M) < 0
+        )
+        and _compare_era_to_year_month(era, start_ym.y, start_ym.M) > 0
+    )
+
+
+def _compare_era_to_year_month(
+    era: ZoneEra,
+    year: int,
+    month: int,
+) -> int:
+    """Compare the zone_era with year, returning -1, 0 or 1. The day of
+    month is implicitly 1. Ignore the until_time_suffix suffix.
+    """
+    if era['until_year'] < year: return -1  # noqa: E701
+    if era['until_year'] > year: return 1  # noqa: E701
+    if era['until_month'] < month: return -1  # noqa: E701
+    if era['until_month'] > month: return 1  # noqa: E701
+    if era['until_day'] > 1: return 1  # noqa: E701
+    if era['until_seconds'] < 0: return -1  # noqa: E701
+    if era['until_seconds'] > 0: return 1  # noqa: E701
+    return 0
 
 
 class TestZoneProcessorHelperMethods(unittest.TestCase):
@@ -68,6 +119,68 @@ class TestZoneProcessorHelperMethods(unittest.TestCase):
                              offset_seconds=7200,
                              delta_seconds=3600))
 
+    def test_add_transition_sorted(self) -> None:
+        match = MatchingEra(
+            start_date_time=DateTuple(2000, 1, 1, 0, 'w'),
+            until_date_time=DateTuple(2001, 1, 1, 0, 'w'),
+            zone_era=TestCompareTransitionToMatch.ZONE_ERA1,
+        )
+        transition_times = [
+            DateTuple(2000, 10, 29, 7200, 'w'),
+            DateTuple(2000, 4, 2, 7200, 'w'),
+            DateTuple(2000, 10, 29, 3600, 'u'),
+            DateTuple(1999, 10, 31, 7200, 'w'),
+        ]
+        transitions: List[Transition] = []
+        keys: List[int] = []
+        for transition_time in transition_times:
+            _add_transition_sorted(
+                transitions,
+                keys,
+                Transition(matching_era=match, transition_time=transition_time),
+                _date_tuple_to_day_key(transition_time),
+            )
+
+        # Transitions on the same date keep their insertion order.
+        self.assertEqual(
+            [
+                DateTuple(1999, 10, 31, 7200, 'w'),
+                DateTuple(2000, 4, 2, 7200, 'w'),
+                DateTuple(2000, 10, 29, 7200, 'w'),
+                DateTuple(2000, 10, 29, 3600, 'u'),
+            ],
+            [t.transition_time for t in transitions],
+        )
+        self.assertEqual(sorted(keys), keys)
+
+    def test_get_format_mode(self) -> None:
+        self.assertEqual((FORMAT_MODE_LITERAL, 'EST', 'EST'),
+                         _get_format_mode('EST'))
+        self.assertEqual((FORMAT_MODE_SLASH, 'GMT', 'BST'),
+                         _get_format_mode('GMT/BST'))
+        self.assertEqual((FORMAT_MODE_LETTER, 'E%sT', 'E%sT'),
+                         _get_format_mode('E%sT'))
+        self.assertEqual((FORMAT_MODE_OFFSET, '', ''),
+                         _get_format_mode('%z'))
+
+    def test_identity_cache(self) -> None:
+        cache: _IdentityCache[str] = _IdentityCache(max_size=2)
+        a = [1]
+        b = [1]
+        cache.put(a, 'a')
+        self.assertEqual('a', cache.get(a))
+        # Equal but distinct objects do not share entries.
+        self.assertIsNone(cache.get(b))
+        cache.put(a, 'a2000', subkey=2000)
+        self.assertEqual('a2000', cache.get(a, 2000))
+        # Looking up 'a' makes it the most recently used entry, so inserting
+        # 'b' evicts 'a2000'.
+        cache.get(a)
+        cache.put(b, 'b')
+        self.assertEqual('a', cache.get(a))
+        self.assertEqual('b', cache.get(b))
+        self.assertIsNone(cache.get(a, 2000))
+
     def test_normalize_date_tuple(self) -> None:
         self.assertEqual(
             DateTuple(2000, 2, 1, 0, 'w'),
@@ -149,6 +262,25 @@ class TestZoneProcessorHelperMethods(unittest.TestCase):
             until_ym=YearMonthTuple(2000, 2),
         )))
 
+    def test_find_matches_agrees_with_era_overlaps_interval(self) -> None:
+        zone_info = zone_infos.ZONE_INFO_America_Indiana_Indianapolis
+        zone_eras = zone_info['eras']
+        zone_processor = ZoneProcessor(zone_info)
+        for year in range(1940, 2010):
+            start_ym = YearMonthTuple(year - 1, 12)
+            until_ym = YearMonthTuple(year + 1, 2)
+            expected = [
+                era for i, era in enumerate(zone_eras)
+                if _era_overlaps_interval(
+                    zone_eras[i - 1] if i > 0 else None,
+                    era,
+                    start_ym,
+                    until_ym,
+                )
+            ]
+            matches = zone_processor._find_matches(start_ym, until_ym)
+            self.assertEqual(expected, [m.zone_era for m in matches])
+
 
 class TestCompareTransitionToMatch(unittest.TestCase):
     # until 2001-03-01T00:00
@@ -251,54 +383,36 @@ class TestCompareTransitionToMatch(unittest.TestCase):
         'until_time_suffix': 'w',
     }
 
-    def test_compare_fuzzy(self) -> None:
+    def test_find_candidate_transitions_fuzzy(self) -> None:
         match = MatchingEra(
-            start_date_time=DateTuple(2000, 1, 1, 0, 'w'),
-            until_date_time=DateTuple(2001, 1, 1, 0, 'w'),
+            start_date_time=DateTuple(2000, 3, 1, 0, 'w'),
+            until_date_time=DateTuple(2000, 10, 1, 0, 'w'),
             zone_era=self.ZONE_ERA,
         )
-
-        transition = Transition(
-            matching_era=match,
-            transition_time=DateTuple(1999, 11, 1, 0, 'w')
-        )
-        self.assertEqual(-1,
-                         _compare_transition_to_match_fuzzy(transition, match))
-
-        transition = Transition(
-            matching_era=match,
-            transition_time=DateTuple(1999, 12, 1, 0, 'w')
-        )
-        self.assertEqual(1,
-                         _compare_transition_to_match_fuzzy(transition, match))
-
-        transition = Transition(
-            matching_era=match,
-            transition_time=DateTuple(2000, 1, 1, 0, 'w')
-        )
-        self.assertEqual(1,
-                         _compare_transition_to_match_fuzzy(transition, match))
-
-        transition = Transition(
-            matching_era=match,
-            transition_time=DateTuple(2001, 1, 1, 0, 'w')
-        )
-        self.assertEqual(1,
-                         _compare_transition_to_match_fuzzy(transition, match))
-
-        transition = Transition(
-            matching_era=match,
-            transition_time=DateTuple(2001, 2, 1, 0, 'w')
-        )
-        self.assertEqual(1,
-                         _compare_transition_to_match_fuzzy(transition, match))
-
-        transition = Transition(
-            matching_era=match,
-            transition_time=DateTuple(2001, 3, 1, 0, 'w')
+        # One rule for each month of 2000, transitioning on the 1st.
+        rules: List[ZoneRule] = [
+            {
+                'from_year': 2000,
+                'to_year': 2000,
+                'in_month': month,
+                'on_day_of_week': 0,
+                'on_day_of_month': 1,
+                'at_seconds': 0,
+                'at_time_suffix': 'w',
+                'delta_seconds': 0,
+                'letter': '',
+            }
+            for month in range(1, 13)
+        ]
+        zone_processor = ZoneProcessor(zone_infos.ZONE_INFO_America_Los_Angeles)
+        transitions = zone_processor._find_candidate_transitions(match, rules)
+        # The fuzzy comparison keeps the transitions from one month before the
+        # match.start to one month after the match.until. Month 1 is the latest
+        # prior transition, and month 12 is far in the future.
+        self.assertEqual(
+            [DateTuple(2000, month, 1, 0, 'w') for month in range(1, 12)],
+            [t.transition_time for t in transitions],
         )
-        self.assertEqual(2,
-                         _compare_transition_to_match_fuzzy(transition, match))
 
 
 class TestZoneProcessorMatchesAndTransitions(unittest.TestCase):
@@ -1080,6 +1194,78 @@ class TestZoneProcessorGetTransition(unittest.TestCase):
         self.assertIsNotNone(transition)
 
 
+class TestZoneProcessorYearCache(unittest.TestCase):
+    def test_restore_from_year_cache(self) -> None:
+        zone_processor = ZoneProcessor(zone_infos.ZONE_INFO_America_Los_Angeles)
+        zone_processor.init_for_year(2006)
+        transitions = zone_processor.transitions
+        buffer_sizes = zone_processor.get_buffer_sizes()
+
+        zone_processor.init_for_year(2007)
+        self.assertIsNot(transitions, zone_processor.transitions)
+
+        # Switching back restores the results and the buffer sizes of 2006.
+        zone_processor.init_for_year(2006)
+        self.assertIs(transitions, zone_processor.transitions)
+        self.assertEqual(buffer_sizes, zone_processor.get_buffer_sizes())
+
+    def test_shared_year_cache(self) -> None:
+        zone_info = zone_infos.ZONE_INFO_Europe_Paris
+        zone_processor = ZoneProcessor(zone_info)
+        zone_processor.init_for_year(2003)
+
+        # A second instance for the same zone reuses the results of 2003.
+        other = ZoneProcessor(zone_info)
+        other.init_for_year(2003)
+        self.assertIs(zone_processor.transitions, other.transitions)
+        self.assertEqual(
+            zone_processor.get_buffer_sizes(),
+            other.get_buffer_sizes(),
+        )
+
+    def test_year_cache_size(self) -> None:
+        zone_processor = ZoneProcessor(zone_infos.ZONE_INFO_America_Los_Angeles)
+        for year in range(2000, 2010):
+            zone_processor.init_for_year(year)
+        self.assertEqual(
+            ZoneProcessor.YEAR_CACHE_SIZE,
+            len(zone_processor.year_cache),
+        )
+        self.assertIn(2009, zone_processor.year_cache)
+        self.assertNotIn(2000, zone_processor.year_cache)
+
+
+class TestZoneProcessorGetTimezoneInfoForSeconds(unittest.TestCase):
+    def test_cached_info_matches_uncached(self) -> None:
+        zone_info = zone_infos.ZONE_INFO_America_Los_Angeles
+        zone_processor = ZoneProcessor(zone_info)
+        # 2000-10-29 01:00 PDT to 2000-10-29 03:00 PST spans the overlap.
+        start = to_epoch_seconds(972806400)
+        for epoch_seconds in range(start, start + 3 * 3600, 600):
+            info = zone_processor.get_timezone_info_for_seconds(epoch_seconds)
+            # Use debug=True to bypass the shared year cache.
+            expected = ZoneProcessor(zone_info, debug=True) \
+                .get_timezone_info_for_seconds(epoch_seconds)
+            self.assertEqual(expected, info)
+
+    def test_cached_info_out_of_order(self) -> None:
+        """The cached interval of the first transition of 1989 must not
+        answer the seconds of 1988, whose first transition is clamped to the
+        start of the window of 1989."""
+        zone_processor = ZoneProcessor(
+            zone_infos.ZONE_INFO_America_Argentina_Jujuy)
+        # 1989-01-15T00:00Z
+        info = zone_processor.get_timezone_info_for_seconds(
+            to_epoch_seconds(600825600))
+        assert info is not None
+        self.assertEqual(-2 * 3600, info.total_offset)
+        # 1988-12-01T02:30Z, -03 until 1988-12-01T03:00Z
+        info = zone_processor.get_timezone_info_for_seconds(
+            to_epoch_seconds(596946600))
+        assert info is not None
+        self.assertEqual(-3 * 3600, info.total_offset)
+
+
 class TestZoneProcessorIsFinalBufferSize(unittest.TestCase):
     def test_los_angeles(self) -> None:
         """America/Los_Angeles uses US Policy, and the last Rule was 2007"""
@@ -45,9 +45,11 @@ dateutil and pytz can handle only 32-bit years until 2038.
 import logging
 import time
 from argparse import ArgumentParser
-from typing import Iterable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Sequence
 from typing import Set
-from typing import Optional
 from typing import Tuple
 import pytz
 from pytz import BaseTzInfo
@@ -85,10 +87,31 @@ class Benchmark:
         dt_until = datetime(self.until_year, 1, 1, tzinfo=timezone.utc)
         self.until_unix_seconds = int(dt_until.timestamp())
 
+        # The samples of the benchmark loops, which are the same for every
+        # zone, so they are generated only once: the (year, month, day) date
+        # components of the 1st and the 28th of every month, and the unix
+        # seconds of every 15 days.
+        self.date_components: List[Tuple[int, int, int]] = [
+            (year, month, day)
+            for year in range(self.start_year, self.until_year)
+            for month in range(1, 13)
+            for day in (1, 28)
+        ]
+        self.unix_seconds_samples: List[int] = list(range(
+            self.start_unix_seconds,
+            self.until_unix_seconds,
+            15 * 86400,
+        ))
+
+        # The pytz and dateutil timezones created by find_common_zones(),
+        # reused by the benchmarks instead of being created again.
+        self.pytz_zones: Dict[str, BaseTzInfo] = {}
+        self.dateutil_zones: Dict[str, tzinfo] = {}
+
     def run(self) -> None:
         print("START")
         print(f"Original timezones: {len(ZONE_REGISTRY)}")
-        common_zones = self.find_common_zones()
+        common_zones = sorted(self.find_common_zones())
         print(f"Common timezones: {len(common_zones)}")
         print(f"Start year: {self.start_year}")
         print(f"Until year: {self.until_year}")
@@ -125,23 +148,26 @@ class Benchmark:
     def print_result(
         self, label: str,
         count1: int,
-        elapsed1: float,
+        elapsed1: int,
         count2: int,
-        elapsed2: float,
+        elapsed2: int,
     ) -> None:
-        """Print label, count, and micros_per_iteration."""
-        perf1 = elapsed1 * 1000000 / count1
-        perf2 = elapsed2 * 1000000 / count2
+        """Print label, count, and micros_per_iteration, given the elapsed
+        nanos.
+        """
+        perf1 = elapsed1 / 1000 / count1
+        perf2 = elapsed2 / 1000 / count2
         print(f"{label} {count1} {perf1:.3f} {count2} {perf2:.3f}")
 
     def find_common_zones(self) -> Set[str]:
-        """Find common zone names."""
+        """Find common zone names. The pytz and dateutil timezones of the
+        common zones are saved in self.pytz_zones and self.dateutil_zones.
+        """
         common_zones: Set[str] = set()
-        tz: Optional[tzinfo]
         for name, zone_info in ZONE_REGISTRY.items():
             # pytz
             try:
-                tz = pytz.timezone(name)
+                pytz_tz = pytz.timezone(name)
             except pytz.UnknownTimeZoneError:
                 continue
 
@@ -149,154 +175,171 @@ class Benchmark:
             try:
                 # The docs is silent on the behavior of gettz() when the name is
                 # not a valid timezone. Handle both None and exception.
-                tz = gettz(name)
-                if tz is None:
+                dateutil_tz = gettz(name)
+                if dateutil_tz is None:
                     continue
             except:  # noqa E722
                 continue
 
             common_zones.add(name)
+            self.pytz_zones[name] = pytz_tz
+            self.dateutil_zones[name] = dateutil_tz
 
         return common_zones
 
-    def run_acetz(self, zones: Iterable[str]) -> Tuple[int, float]:
-        """Return count and micros per iteration."""
-        start = time.time()
-        count = 0
-        for name in zones:
+    def _warm_up(
+        self,
+        fn: Callable[[str], int],
+        zones: Sequence[str],
+    ) -> None:
+        """Run an untimed pass of 'fn' over the first zone, to exclude the
+        first-call costs from the timed loop.
+        """
+        if zones:
+            fn(zones[0])
+
+    def run_acetz(self, zones: Sequence[str]) -> Tuple[int, int]:
+        """Return count and elapsed nanos."""
+        def loop(name: str) -> int:
             tz = self.zone_manager.gettz(name)
             assert tz is not None
-            count += self.loop_components_to_epoch_tz(tz)
-        elapsed = time.time() - start
-        return count, elapsed
+            return self.loop_components_to_epoch_tz(tz)
 
-    def run_acetz_epoch(self, zones: Iterable[str]) -> Tuple[int, float]:
-        """Return count and micros per iteration."""
-        start = time.time()
+        self._warm_up(loop, zones)
+        start = time.perf_counter_ns()
         count = 0
         for name in zones:
+            count += loop(name)
+        elapsed = time.perf_counter_ns() - start
+        return count, elapsed
+
+    def run_acetz_epoch(self, zones: Sequence[str]) -> Tuple[int, int]:
+        """Return count and elapsed nanos."""
+        def loop(name: str) -> int:
             tz = self.zone_manager.gettz(name)
             assert tz is not None
-            count += self.loop_epoch_to_components_tz(tz)
-        elapsed = time.time() - start
-        return count, elapsed
+            return self.loop_epoch_to_components_tz(tz)
 
-    def run_dateutil(self, zones: Iterable[str]) -> Tuple[int, float]:
-        """Return count and micros per iteration."""
-        start = time.time()
+        self._warm_up(loop, zones)
+        start = time.perf_counter_ns()
         count = 0
         for name in zones:
-            tz = gettz(name)
-            assert tz is not None
-            count += self.loop_components_to_epoch_tz(tz)
-        elapsed = time.time() - start
+            count += loop(name)
+        elapsed = time.perf_counter_ns() - start
         return count, elapsed
 
-    def run_dateutil_epoch(self, zones: Iterable[str]) -> Tuple[int, float]:
-        """Return count and micros per iteration."""
-        start = time.time()
+    def run_dateutil(self, zones: Sequence[str]) -> Tuple[int, int]:
+        """Return count and elapsed nanos."""
+        def loop(name: str) -> int:
+            return self.loop_components_to_epoch_tz(self.dateutil_zones[name])
+
+        self._warm_up(loop, zones)
+        start = time.perf_counter_ns()
         count = 0
         for name in zones:
-            tz = gettz(name)
-            assert tz is not None
-            count += self.loop_epoch_to_components_tz(tz)
-        elapsed = time.time() - start
+            count += loop(name)
+        elapsed = time.perf_counter_ns() - start
         return count, elapsed
 
-    def run_pytz(self, zones: Iterable[str]) -> Tuple[int, float]:
-        """Return count and micros per iteration."""
-        start = time.time()
+    def run_dateutil_epoch(self, zones: Sequence[str]) -> Tuple[int, int]:
+        """Return count and elapsed nanos."""
+        def loop(name: str) -> int:
+            return self.loop_epoch_to_components_tz(self.dateutil_zones[name])
+
+        self._warm_up(loop, zones)
+        start = time.perf_counter_ns()
         count = 0
         for name in zones:
-            tz = pytz.timezone(name)
-            count += self.loop_components_to_epoch_pytz(tz)
-        elapsed = time.time() - start
+            count += loop(name)
+        elapsed = time.perf_counter_ns() - start
         return count, elapsed
 
-    def run_pytz_epoch(self, zones: Iterable[str]) -> Tuple[int, float]:
-        """Return count and micros per iteration."""
-        start = time.time()
+    def run_pytz(self, zones: Sequence[str]) -> Tuple[int, int]:
+        """Return count and elapsed nanos."""
+        def loop(name: str) -> int:
+            return self.loop_components_to_epoch_pytz(self.pytz_zones[name])
+
+        self._warm_up(loop, zones)
+        start = time.perf_counter_ns()
         count = 0
         for name in zones:
-            tz = pytz.timezone(name)
-            count += self.loop_epoch_to_components_pytz(tz)
-        elapsed = time.time() - start
+            count += loop(name)
+        elapsed = time.perf_counter_ns() - start
         return count, elapsed
 
-    def run_zoneinfo(self, zones: Iterable[str]) -> Tuple[int, float]:
-        """Return count and micros per iteration."""
-        start = time.time()
+    def run_pytz_epoch(self, zones: Sequence[str]) -> Tuple[int, int]:
+        """Return count and elapsed nanos."""
+        def loop(name: str) -> int:
+            return self.loop_epoch_to_components_pytz(self.pytz_zones[name])
+
+        self._warm_up(loop, zones)
+        start = time.perf_counter_ns()
         count = 0
         for name in zones:
-            tz = zoneinfo.ZoneInfo(name)
-            assert tz is not None
-            count += self.loop_components_to_epoch_tz(tz)
-        elapsed = time.time() - start
+            count += loop(name)
+        elapsed = time.perf_counter_ns() - start
         return count, elapsed
 
-    def run_zoneinfo_epoch(self, zones: Iterable[str]) -> Tuple[int, float]:
-        """Return count and micros per iteration."""
-        start = time.time()
+    def run_zoneinfo(self, zones: Sequence[str]) -> Tuple[int, int]:
+        """Return count and elapsed nanos."""
+        def loop(name: str) -> int:
+            tz = zoneinfo.ZoneInfo(name)
+            return self.loop_components_to_epoch_tz(tz)
+
+        self._warm_up(loop, zones)
+        start = time.perf_counter_ns()
         count = 0
         for name in zones:
+            count += loop(name)
+        elapsed = time.perf_counter_ns() - start
+        return count, elapsed
+
+    def run_zoneinfo_epoch(self, zones: Sequence[str]) -> Tuple[int, int]:
+        """Return count and elapsed nanos."""
+        def loop(name: str) -> int:
             tz = zoneinfo.ZoneInfo(name)
-            assert tz is not None
-            count += self.loop_epoch_to_components_tz(tz)
-        elapsed = time.time() - start
+            return self.loop_epoch_to_components_tz(tz)
+
+        self._warm_up(loop, zones)
+        start = time.perf_counter_ns()
+        count = 0
+        for name in zones:
+            count += loop(name)
+        elapsed = time.perf_counter_ns() - start
         return count, elapsed
 
     def loop_components_to_epoch_tz(self, tz: tzinfo) -> int:
         """Return number of iterations for given tz."""
-        count = 0
-        for year in range(self.start_year, self.until_year):
-            for month in range(1, 13):
-                for day in (1, 28):  # check the 1st and the 28th
-                    count += 1
-                    dt = datetime(year, month, day, 1, 2, 3, tzinfo=tz)
-                    int(dt.timestamp())
-        return count
+        for year, month, day in self.date_components:
+            dt = datetime(year, month, day, 1, 2, 3, tzinfo=tz)
+            int(dt.timestamp())
+        return len(self.date_components)
 
     def loop_epoch_to_components_tz(self, tz: tzinfo) -> int:
         """Return number of iterations for given tz."""
-        count = 0
-        for unix_seconds in range(
-            self.start_unix_seconds,
-            self.until_unix_seconds,
-            15 * 86400,  # every 15 days
-        ):
-            count += 1
+        for unix_seconds in self.unix_seconds_samples:
             datetime.fromtimestamp(unix_seconds, tz=tz)
-        return count
+        return len(self.unix_seconds_samples)
 
     def loop_components_to_epoch_pytz(self, tz: BaseTzInfo) -> int:
         """Return elapsed millis per iteration for given pytz.
         pytz provides only 2 ways to create a timezone-aware datetime:
         localize() and normalilze(), so use localize().
         """
-        count = 0
-        for year in range(self.start_year, self.until_year):
-            for month in range(1, 13):
-                for day in (1, 28):  # check the 1st and the 28th
-                    count += 1
-                    dt_wall = datetime(year, month, day, 1, 2, 3)
-                    dt = tz.localize(dt_wall)
-                    int(dt.timestamp())
-        return count
+        for year, month, day in self.date_components:
+            dt_wall = datetime(year, month, day, 1, 2, 3)
+            dt = tz.localize(dt_wall)
+            int(dt.timestamp())
+        return len(self.date_components)
 
     def loop_epoch_to_components_pytz(self, tz: BaseTzInfo) -> int:
-        """Return elapsed millis per iteration for given pytz.
-        pytz provides only 2 ways to create a timezone-aware datetime:
-        localize() and normalilze(), so use localize().
+        """Return number of iterations for given pytz.
+        Unlike the wall time of localize(), the unix seconds are a UTC instant,
+        so datetime.fromtimestamp() can use the pytz fromutc() directly.
         """
-        count = 0
-        for unix_seconds in range(
-            self.start_unix_seconds,
-            self.until_unix_seconds,
-            15 * 86400,  # every 15 days
-        ):
-            count += 1
-            tz.localize(datetime.utcfromtimestamp(unix_seconds))
-        return count
+        for unix_seconds in self.unix_seconds_samples:
+            datetime.fromtimestamp(unix_seconds, tz=tz)
+        return len(self.unix_seconds_samples)
 
 
 def main() -> None:
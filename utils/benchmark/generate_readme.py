@@ -1,13 +1,52 @@
 #!/usr/bin/python3
 #
-# Python script that regenerates the README.md from the embedded template. Uses
-# ./generate_table.awk to regenerate the ASCII tables from the various *.txt
-# files.
+# Python script that regenerates the README.md from the embedded template. The
+# ASCII table is generated from the benchmark.txt file by generate_table().
 
-from subprocess import check_output
+from typing import List
 
-results = check_output(
-    "./generate_table.awk < benchmark.txt", shell=True, text=True)
+
+def generate_table(filename: str) -> str:
+    """Read the *.txt file generated by benchmark.py and generate an ASCII
+    table that can be inserted into the README.md. The benchmark lines are
+    between the 'BENCHMARKS' and 'END' markers, in the format of
+    'LABEL count1 micros1 count2 micros2'.
+    """
+    lines: List[str] = []
+    lines.append("+-------------------+----------------+----------------+")
+    lines.append("| Time Zone Library | comp to epoch  | epoch to comp  |")
+    lines.append("|                   | (micros/iter)  | (micros/iter)  |")
+
+    collect_benchmarks = False
+    with open(filename) as f:
+        for line in f:
+            if line.startswith('BENCHMARKS'):
+                collect_benchmarks = True
+                continue
+            if line.startswith('END'):
+                collect_benchmarks = False
+                continue
+            if not collect_benchmarks:
+                continue
+
+            # Skip blank or malformed lines.
+            fields = line.split()
+            if len(fields) != 5:
+                continue
+            name, _, micros1, _, micros2 = fields
+            if name.startswith('acetimepy'):
+                lines.append(
+                    "|-------------------+----------------+----------------|")
+            lines.append(
+                f"| {name:<17} | {float(micros1):14.3f} "
+                f"| {float(micros2):14.3f} |"
+            )
+
+    lines.append("+-------------------+----------------+----------------+")
+    return '\n'.join(lines) + '\n'
+
+
+results = generate_table('benchmark.txt')
 
 print(f"""\
 # Acetz Benchmark
@@ -9,9 +9,10 @@ report of the discrepencies.
 """
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone, tzinfo
 from argparse import ArgumentParser
-from typing import Any, Tuple, List
+from typing import Any, Iterable, Tuple, List, Optional
 import sys
 
 # Using sys.version_info works better for MyPy than using a try/except block.
@@ -30,6 +31,21 @@ from acetime.zonedball.zone_registry import ZONE_REGISTRY
 # and flag that is True if ONLY the DST changed.
 TransitionTimes = Tuple[datetime, datetime, bool]
 
+# The (utcoffset, dst) of a datetime.
+Offsets = Tuple[Optional[timedelta], Optional[timedelta]]
+
+# The naive datetime of the unix epoch.
+UNIX_EPOCH = datetime(1970, 1, 1)
+
+
+def to_unix_seconds(dt: datetime, total_offset: int) -> int:
+    """Return the unix seconds of the aware 'dt' whose utcoffset() is the given
+    'total_offset' in seconds. Same as int(dt.timestamp()) for a 'dt' without
+    microseconds, but without calling utcoffset() again.
+    """
+    delta = dt.replace(tzinfo=None) - UNIX_EPOCH
+    return delta.days * 86400 + delta.seconds - total_offset
+
 
 class Comparator():
     def __init__(
@@ -44,21 +60,25 @@ class Comparator():
         self.sampling_interval = timedelta(hours=sampling_interval)
         self.zone_manager = zone_manager
 
-    def compare_zone(self, zone_name: str) -> None:
-        self.has_diff = False
+    def compare_zone(self, zone_name: str) -> List[str]:
+        """Compare the given zone, and return the lines of its variance
+        report, which is empty if no variances were found.
+        """
+        self.variances: List[str] = []
         self.zone_name = zone_name
 
         zi_tz = zoneinfo.ZoneInfo(zone_name)
         if not zi_tz:
             logging.error(f"Zone '{zone_name}' not found in zoneinfo package")
-            return
+            return self.variances
 
         ace_tz = self.zone_manager.gettz(zone_name)
         if not ace_tz:
             logging.error(f"Zone '{zone_name}' not found in acetime package")
-            return
+            return self.variances
 
         self._diff_tz(zi_tz, ace_tz)
+        return self.variances
 
     def _diff_tz(self, zi_tz: tzinfo, ace_tz: tzinfo) -> None:
         """Find the DST transitions from start_year to until_year, and determine
@@ -79,38 +99,39 @@ class Comparator():
         # TODO: Do I need to start 1 day before Jan 1 UTC, in case the
         # local time is ahead of UTC?
         dt = datetime(self.start_year, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-        dt_local = dt.astimezone(tz)
+        offsets = self.get_offsets(dt.astimezone(tz))
 
-        # Check every 'sampling_interval' hours for a transition
+        # Check every 'sampling_interval' hours for a transition. The offsets
+        # of the previous sample are carried over, so that each sample calls
+        # utcoffset() and dst() only once.
         transitions: List[TransitionTimes] = []
         while True:
             next_dt = dt + self.sampling_interval
             next_dt_local = next_dt.astimezone(tz)
             if next_dt.year >= self.until_year:
                 break
+            next_offsets = self.get_offsets(next_dt_local)
 
             # Look for a UTC or DST transition.
-            if self.is_transition(dt_local, next_dt_local):
-                # print(f'Transition between {dt_local} and {next_dt_local}')
+            if offsets != next_offsets:
+                # print(f'Transition between {dt} and {next_dt_local}')
                 dt_left, dt_right = self._binary_search_transition(
-                    tz, dt, next_dt)
+                    tz, dt, next_dt, offsets)
                 dt_left_local = dt_left.astimezone(tz)
                 dt_right_local = dt_right.astimezone(tz)
                 only_dst = self.only_dst(dt_left_local, dt_right_local)
                 transitions.append((dt_left_local, dt_right_local, only_dst))
 
             dt = next_dt
-            dt_local = next_dt_local
+            offsets = next_offsets
 
         return transitions
 
-    def is_transition(self, dt1: datetime, dt2: datetime) -> bool:
-        """Determine if dt1 -> dt2 is a UTC offset transition. If
-        detect_dst_transition is True, then also detect DST offset transition.
+    def get_offsets(self, dt: datetime) -> Offsets:
+        """Return the (utcoffset, dst) of dt. A UTC offset or DST offset
+        transition occurs between 2 datetimes if their offsets are different.
         """
-        if dt1.utcoffset() != dt2.utcoffset():
-            return True
-        return dt1.dst() != dt2.dst()
+        return (dt.utcoffset(), dt.dst())
 
     def only_dst(self, dt1: datetime, dt2: datetime) -> bool:
         """Determine if dt1 -> dt2 is only a DST transition."""
@@ -121,28 +142,36 @@ class Comparator():
         tz: tzinfo,
         dt_left: datetime,
         dt_right: datetime,
+        left_offsets: Offsets,
     ) -> Tuple[datetime, datetime]:
         """Do a binary search to find the exact transition times, to within 1
         minute accuracy. The dt_left and dt_right are 22 hours (1320 minutes)
         apart. So the binary search should take a maximum of 11 iterations to
-        find the DST transition within one adjacent minute.
+        find the DST transition within one adjacent minute. The left_offsets
+        are the already known get_offsets() of dt_left.
+
+        The search is done on the integer unix seconds of the UTC 'dt_left'
+        and 'dt_right', instead of creating timedelta objects.
         """
-        dt_left_local = dt_left.astimezone(tz)
+        left_seconds = int(dt_left.timestamp())
+        right_seconds = int(dt_right.timestamp())
         while True:
-            delta_minutes = int((dt_right - dt_left) / timedelta(minutes=1))
-            delta_minutes //= 2
+            delta_minutes = (right_seconds - left_seconds) // 60 // 2
             if delta_minutes == 0:
                 break
 
-            dt_mid = dt_left + timedelta(minutes=delta_minutes)
-            mid_dt_local = dt_mid.astimezone(tz)
-            if self.is_transition(dt_left_local, mid_dt_local):
-                dt_right = dt_mid
+            mid_seconds = left_seconds + delta_minutes * 60
+            dt_mid = datetime.fromtimestamp(mid_seconds, tz=timezone.utc)
+            mid_offsets = self.get_offsets(dt_mid.astimezone(tz))
+            if left_offsets != mid_offsets:
+                right_seconds = mid_seconds
             else:
-                dt_left = dt_mid
-                dt_left_local = mid_dt_local
+                left_seconds = mid_seconds
 
-        return dt_left, dt_right
+        return (
+            datetime.fromtimestamp(left_seconds, tz=timezone.utc),
+            datetime.fromtimestamp(right_seconds, tz=timezone.utc),
+        )
 
     def _check_dt(self, dt: datetime, ace_tz: tzinfo) -> None:
         """Check that the given 'dt' computed using zoneinfo.ZoneInfo matches
@@ -150,9 +179,11 @@ class Comparator():
         class.
         """
 
-        # Extract the components of the zoneinfo version of datetime.
-        unix_seconds = int(dt.timestamp())
+        # Extract the components of the zoneinfo version of datetime. The unix
+        # seconds are calculated from the total offset, instead of calling
+        # dt.timestamp() which would look up the utcoffset() again.
         total_offset = int(dt.utcoffset().total_seconds())  # type: ignore
+        unix_seconds = to_unix_seconds(dt, total_offset)
         dst_offset = int(dt.dst().total_seconds())  # type: ignore
         # See https://stackoverflow.com/questions/5946499 for more info on how
         # to extract the abbreviation. dt.tzinfo will never be None because the
@@ -163,10 +194,11 @@ class Comparator():
         # Extract the components of the acetz version of datetime. Consider
         # these to be the "expected".
         expected = dt.astimezone(ace_tz)
-        expected_unix_seconds = int(expected.timestamp())
         expected_total_offset = int(
             expected.utcoffset().total_seconds()  # type: ignore
         )
+        expected_unix_seconds = to_unix_seconds(
+            expected, expected_total_offset)
         expected_dst_offset = int(
             expected.dst().total_seconds()  # type: ignore
         )
@@ -195,54 +227,58 @@ class Comparator():
                 expected_total_offset,
                 total_offset,
             )
-        if expected.year != dt.year:
-            self.print_variance(
-                "year",
-                unix_seconds,
-                dt,
-                expected.year,
-                dt.year,
-            )
-        if expected.month != dt.month:
-            self.print_variance(
-                "month",
-                unix_seconds,
-                dt,
-                expected.month,
-                dt.month,
-            )
-        if expected.day != dt.day:
-            self.print_variance(
-                "day",
-                unix_seconds,
-                dt,
-                expected.day,
-                dt.day,
-            )
-        if expected.hour != dt.hour:
-            self.print_variance(
-                "hour",
-                unix_seconds,
-                dt,
-                expected.hour,
-                dt.hour,
-            )
-        if expected.minute != dt.minute:
-            self.print_variance(
-                "minute",
-                unix_seconds,
-                dt,
-                expected.minute,
-                dt.minute,
-            )
-        if expected.second != dt.second:
-            self.print_variance(
-                "second",
-                unix_seconds,
-                dt,
-                expected.second,
-                dt.second,
-            )
+
+            # The date and time components are determined by the unix seconds
+            # (verified above) and the total offset, so they can differ only
+            # if the total offsets differ. Report them for diagnostics.
+            if expected.year != dt.year:
+                self.print_variance(
+                    "year",
+                    unix_seconds,
+                    dt,
+                    expected.year,
+                    dt.year,
+                )
+            if expected.month != dt.month:
+                self.print_variance(
+                    "month",
+                    unix_seconds,
+                    dt,
+                    expected.month,
+                    dt.month,
+                )
+            if expected.day != dt.day:
+                self.print_variance(
+                    "day",
+                    unix_seconds,
+                    dt,
+                    expected.day,
+                    dt.day,
+                )
+            if expected.hour != dt.hour:
+                self.print_variance(
+                    "hour",
+                    unix_seconds,
+                    dt,
+                    expected.hour,
+                    dt.hour,
+                )
+            if expected.minute != dt.minute:
+                self.print_variance(
+                    "minute",
+                    unix_seconds,
+                    dt,
+                    expected.minute,
+                    dt.minute,
+                )
+            if expected.second != dt.second:
+                self.print_variance(
+                    "second",
+                    unix_seconds,
+                    dt,
+                    expected.second,
+                    dt.second,
+                )
         if expected_abbrev != abbrev:
             self.print_variance(
                 "abbrev",
@@ -260,17 +296,53 @@ class Comparator():
         expected: Any,
         observed: Any,
     ) -> None:
-        # Print zone on the first variance
-        if not self.has_diff:
-            print(f"Zone {self.zone_name}")
-            self.has_diff = True
+        # Add the zone name before the first variance
+        if not self.variances:
+            self.variances.append(f"Zone {self.zone_name}")
 
-        print(
+        self.variances.append(
             f"{unix_seconds}: {dt}: {label}: "
             f"acetz {expected}; zoneinfo {observed}"
         )
 
 
+# The Comparator of a worker process, created by init_worker().
+worker_comparator: Optional[Comparator] = None
+
+
+def init_worker(
+    start_year: int,
+    until_year: int,
+    sampling_interval: int,
+) -> None:
+    """Create the Comparator used by compare_zone_in_worker() for all the
+    zones handled by the current worker process.
+    """
+    global worker_comparator
+    logging.basicConfig(level=logging.INFO)
+    worker_comparator = Comparator(
+        start_year=start_year,
+        until_year=until_year,
+        sampling_interval=sampling_interval,
+        zone_manager=ZoneManager(ZONE_REGISTRY),
+    )
+
+
+def compare_zone_in_worker(zone_name: str) -> List[str]:
+    assert worker_comparator is not None
+    return worker_comparator.compare_zone(zone_name)
+
+
+def print_reports(zone_names: List[str], reports: Iterable[List[str]]) -> None:
+    """Print the variance reports of the zones, in the order of zone_names.
+    The report of each zone is written with a single write().
+    """
+    for i, (zone_name, report) in enumerate(zip(zone_names, reports)):
+        print(f"[{i}] {zone_name}...", file=sys.stderr)
+        if report:
+            sys.stdout.write('\n'.join(report) + '\n')
+
+
 def main() -> None:
     parser = ArgumentParser(description='Compare acetime and zoneinfo.')
 
@@ -290,6 +362,12 @@ def main() -> None:
         default=22,
         help='Sampling interval in hours (default 22)',
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Number of worker processes comparing zones (default 1)',
+    )
 
     args = parser.parse_args()
 
@@ -319,19 +397,30 @@ def main() -> None:
 # [...]
 """)
 
-    # Generate report for non-matching zones.
-    zone_manager = ZoneManager(ZONE_REGISTRY)
-    comparator = Comparator(
-        start_year=args.start_year,
-        until_year=args.until_year,
-        sampling_interval=args.sampling_interval,
-        zone_manager=zone_manager,
-    )
-    i = 0
-    for zone_name, zone_info in ZONE_REGISTRY.items():
-        print(f"[{i}] {zone_name}...", file=sys.stderr)
-        comparator.compare_zone(zone_name)
-        i += 1
+    # Generate report for non-matching zones. The zones are independent of
+    # each other, so they can be compared in parallel by worker processes,
+    # while the reports are still printed in the order of the registry.
+    zone_names = list(ZONE_REGISTRY.keys())
+    if args.jobs > 1:
+        with ProcessPoolExecutor(
+            max_workers=args.jobs,
+            initializer=init_worker,
+            initargs=(
+                args.start_year, args.until_year, args.sampling_interval),
+        ) as executor:
+            print_reports(
+                zone_names,
+                executor.map(compare_zone_in_worker, zone_names, chunksize=4),
+            )
+    else:
+        zone_manager = ZoneManager(ZONE_REGISTRY)
+        comparator = Comparator(
+            start_year=args.start_year,
+            until_year=args.until_year,
+            sampling_interval=args.sampling_interval,
+            zone_manager=zone_manager,
+        )
+        print_reports(zone_names, map(comparator.compare_zone, zone_names))
 
 
 if __name__ == '__main__':
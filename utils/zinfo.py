@@ -92,7 +92,8 @@ def main() -> None:
             logging.info('==== Final matches and transitions')
         zone_processor.print_matches_and_transitions()
     elif args.date:
-        dt: datetime = datetime.strptime(args.date, "%Y-%m-%dT%H:%M")
+        # The --date is in ISO 8601 format (yyyy-mm-ddThh:mm).
+        dt: datetime = datetime.fromisoformat(args.date)
         if args.transition:
             transition = zone_processor.get_transition_for_datetime(dt)
             if transition: